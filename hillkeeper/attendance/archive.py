@@ -0,0 +1,167 @@
+import logging
+from datetime import date, datetime
+
+from ..config import KST
+from ..database.sqlite import sqlite_client
+from . import repository
+
+logger = logging.getLogger('hillkeeper')
+
+
+def _insert(conn, events: list[tuple], responses: list[tuple]):
+    with conn:
+        conn.executemany(
+            "INSERT OR IGNORE INTO events (message_id, date, channel_id, role_id, created_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            events
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO responses (message_id, user_id, date, response, responded_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            responses
+        )
+
+
+async def archive_events(events: list[dict], responses: dict[int, list[dict]]):
+    """
+    이벤트와 응답을 아카이브에 한 번의 트랜잭션으로 추가합니다.
+    이미 보관된 이벤트/응답은 건너뛰므로 여러 번 실행해도 안전합니다.
+
+    Args:
+        events: scan_events 형식의 이벤트 데이터 리스트
+        responses: 메시지 ID -> get_responses 형식의 응답 리스트
+    """
+    event_rows = [
+        (int(e["message_id"]), e["date"], int(e["channel_id"]), int(e["role_id"]), e["created_at"])
+        for e in events
+    ]
+    response_rows = [
+        (int(e["message_id"]), int(r["user_id"]), e["date"], r["response"],
+         int(datetime.fromisoformat(r["timestamp"]).timestamp()))
+        for e in events
+        for r in responses.get(int(e["message_id"]), [])
+    ]
+
+    await sqlite_client.run(lambda conn: _insert(conn, event_rows, response_rows))
+
+
+async def archive_closed_events(*, page_size: int = 100) -> tuple[int, int]:
+    """
+    마감된(오늘 이전 날짜의) 출석 이벤트와 응답을 Redis에서 아카이브로 복사합니다.
+    Redis TTL(7일)보다 자주 실행하면 만료 전에 모든 기록이 보관됩니다.
+
+    Args:
+        page_size: 한 페이지에 읽을 이벤트 수 (기본값: 100)
+
+    Returns:
+        (보관한 이벤트 수, 보관한 응답 수) 튜플
+    """
+    today = datetime.now(KST).date().isoformat()
+    archived_events = archived_responses = 0
+
+    cursor = ""
+    while True:
+        cursor, events = await repository.scan_events(cursor, count=page_size)
+        closed = [e for e in events if e["date"] < today]
+
+        if closed:
+            responses = {
+                int(e["message_id"]): await repository.get_responses(int(e["message_id"]))
+                for e in closed
+            }
+            await archive_events(closed, responses)
+            archived_events += len(closed)
+            archived_responses += sum(len(r) for r in responses.values())
+
+        if not cursor:
+            break
+
+    logger.info(f"Archived {archived_events} events and {archived_responses} responses")
+    return archived_events, archived_responses
+
+
+async def get_events_between(start: date, end: date) -> list[dict]:
+    """
+    기간 내 보관된 출석 이벤트를 참석/불참 집계와 함께 조회합니다.
+
+    Args:
+        start: 시작 날짜 (포함)
+        end: 종료 날짜 (포함)
+
+    Returns:
+        날짜 오름차순 이벤트 리스트 (yes_count, no_count 포함)
+    """
+    def query(conn):
+        rows = conn.execute(
+            """
+            SELECT e.message_id, e.date, e.channel_id, e.role_id, e.created_at,
+                   COALESCE(SUM(r.response = 'yes'), 0) AS yes_count,
+                   COALESCE(SUM(r.response = 'no'), 0) AS no_count
+            FROM events e
+            LEFT JOIN responses r ON r.message_id = e.message_id
+            WHERE e.date BETWEEN ? AND ?
+            GROUP BY e.message_id
+            ORDER BY e.date, e.message_id
+            """,
+            (start.isoformat(), end.isoformat())
+        )
+        return [dict(row) for row in rows]
+
+    return await sqlite_client.run(query)
+
+
+async def get_user_history(user_id: int, *, start: date | None = None, end: date | None = None) -> list[dict]:
+    """
+    사용자의 보관된 응답 기록을 조회합니다.
+
+    Args:
+        user_id: 사용자 ID
+        start: 시작 날짜 (포함, 기본값: 전체)
+        end: 종료 날짜 (포함, 기본값: 전체)
+
+    Returns:
+        날짜 오름차순 응답 리스트 (message_id, date, response, responded_at)
+    """
+    start = (start or date.min).isoformat()
+    end = (end or date.max).isoformat()
+
+    def query(conn):
+        rows = conn.execute(
+            """
+            SELECT message_id, date, response, responded_at
+            FROM responses
+            WHERE user_id = ? AND date BETWEEN ? AND ?
+            ORDER BY date
+            """,
+            (user_id, start, end)
+        )
+        return [dict(row) for row in rows]
+
+    return await sqlite_client.run(query)
+
+
+async def get_attendance_rate(start: date, end: date) -> list[dict]:
+    """
+    기간 내 사용자별 참석 횟수를 집계합니다.
+
+    Args:
+        start: 시작 날짜 (포함)
+        end: 종료 날짜 (포함)
+
+    Returns:
+        참석 횟수 내림차순 리스트 (user_id, yes_count, responses)
+    """
+    def query(conn):
+        rows = conn.execute(
+            """
+            SELECT user_id, SUM(response = 'yes') AS yes_count, COUNT(*) AS responses
+            FROM responses
+            WHERE date BETWEEN ? AND ?
+            GROUP BY user_id
+            ORDER BY yes_count DESC, user_id
+            """,
+            (start.isoformat(), end.isoformat())
+        )
+        return [dict(row) for row in rows]
+
+    return await sqlite_client.run(query)
@@ -0,0 +1,178 @@
+import csv
+import io
+import json
+import logging
+from typing import AsyncIterator, Callable
+
+from aiohttp import web
+
+from ..auth import require_bearer_token
+from ..config import get_env
+from . import repository
+
+logger = logging.getLogger('hillkeeper')
+
+PAGE_SIZE = 100
+
+CSV_COLUMNS = [
+    "type", "date", "message_id", "channel_id", "role_id",
+    "user_id", "username", "response", "timestamp"
+]
+
+CONTENT_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+UsernameResolver = Callable[[dict, str], str | None]
+
+
+async def iter_records(*, page_size: int = PAGE_SIZE,
+                       resolve_username: UsernameResolver | None = None) -> AsyncIterator[list[dict]]:
+    """
+    출석 이벤트와 응답을 페이지 단위로 내보냅니다.
+    이벤트는 인덱스 커서, 응답은 HSCAN 커서로 순회하므로 한 번에 한 페이지만 메모리에 올립니다.
+
+    Args:
+        page_size: 커서 한 번에 읽을 이벤트/응답 개수 (기본값: 100)
+        resolve_username: (이벤트, user_id) -> 표시 이름. 없으면 username은 비워둡니다.
+
+    Yields:
+        레코드 딕셔너리 리스트. 이벤트 레코드 뒤에 해당 이벤트의 응답 레코드가 이어집니다.
+    """
+    cursor = ""
+    while True:
+        cursor, events = await repository.scan_events(cursor, count=page_size)
+
+        for event in events:
+            yield [{
+                "type": "event",
+                "date": event["date"],
+                "message_id": event["message_id"],
+                "channel_id": event["channel_id"],
+                "role_id": event["role_id"],
+                "timestamp": event["created_at"],
+            }]
+
+            response_cursor = 0
+            while True:
+                response_cursor, responses = await repository.scan_responses(
+                    int(event["message_id"]),
+                    response_cursor,
+                    count=page_size
+                )
+                if responses:
+                    yield [{
+                        "type": "response",
+                        "date": event["date"],
+                        "message_id": event["message_id"],
+                        "user_id": response["user_id"],
+                        "username": resolve_username(event, response["user_id"]) if resolve_username else None,
+                        "response": response["response"],
+                        "timestamp": response["timestamp"],
+                    } for response in responses]
+                if response_cursor == 0:
+                    break
+
+        if not cursor:
+            break
+
+
+def format_ndjson(records: list[dict]) -> str:
+    """레코드 리스트를 NDJSON 문자열로 변환합니다."""
+    return "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+
+
+def format_csv(records: list[dict], *, header: bool = False) -> str:
+    """레코드 리스트를 CSV 문자열로 변환합니다. header=True면 컬럼 행을 앞에 붙입니다."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=CSV_COLUMNS, extrasaction="ignore", lineterminator="\n")
+    if header:
+        writer.writeheader()
+    writer.writerows(records)
+    return buffer.getvalue()
+
+
+async def iter_export(fmt: str, *, page_size: int = PAGE_SIZE,
+                      resolve_username: UsernameResolver | None = None) -> AsyncIterator[str]:
+    """
+    출석 데이터를 지정한 형식의 텍스트 청크로 내보냅니다.
+
+    Args:
+        fmt: "ndjson" 또는 "csv"
+        page_size: 커서 한 번에 읽을 이벤트/응답 개수
+        resolve_username: (이벤트, user_id) -> 표시 이름
+
+    Yields:
+        페이지 하나 분량의 텍스트 청크
+    """
+    if fmt not in CONTENT_TYPES:
+        raise ValueError(f"Unsupported export format: {fmt}")
+
+    if fmt == "csv":
+        yield format_csv([], header=True)
+
+    async for records in iter_records(page_size=page_size, resolve_username=resolve_username):
+        yield format_ndjson(records) if fmt == "ndjson" else format_csv(records)
+
+
+def member_name_resolver(bot) -> UsernameResolver:
+    """
+    봇의 멤버 캐시에서 표시 이름을 찾는 resolver를 만듭니다.
+
+    Args:
+        bot: Discord 봇 인스턴스
+
+    Returns:
+        (이벤트, user_id) -> 표시 이름 함수. 찾을 수 없으면 None을 반환합니다.
+    """
+    def resolve(event: dict, user_id: str) -> str | None:
+        channel = bot.get_channel(int(event["channel_id"]))
+        if not channel:
+            return None
+        member = channel.guild.get_member(int(user_id))
+        return member.display_name if member else None
+
+    return resolve
+
+
+def register_export_routes(app: web.Application, bot):
+    """
+    출석 데이터 내보내기 라우트를 등록합니다.
+    EXPORT_TOKEN이 설정되지 않으면 라우트를 등록하지 않습니다.
+
+    GET /export/attendance?format=ndjson|csv
+    Authorization: Bearer <EXPORT_TOKEN>
+
+    Args:
+        app: aiohttp 애플리케이션
+        bot: 사용자 표시 이름 조회에 사용할 Discord 봇 인스턴스
+    """
+    token = get_env('EXPORT_TOKEN')
+    if not token:
+        return
+
+    async def export_attendance(request: web.Request) -> web.StreamResponse:
+        require_bearer_token(request, token)
+
+        fmt = request.query.get('format', 'ndjson')
+        if fmt not in CONTENT_TYPES:
+            raise web.HTTPBadRequest(text=f"format must be one of: {', '.join(CONTENT_TYPES)}")
+
+        response = web.StreamResponse()
+        response.content_type = CONTENT_TYPES[fmt]
+        response.charset = 'utf-8'
+        response.headers['Content-Disposition'] = f'attachment; filename="attendance.{fmt}"'
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+
+        chunks = 0
+        async for chunk in iter_export(fmt, resolve_username=member_name_resolver(bot)):
+            await response.write(chunk.encode('utf-8'))
+            chunks += 1
+
+        await response.write_eof()
+        logger.info(f"Attendance export streamed ({fmt}, {chunks} chunks)")
+        return response
+
+    app.router.add_get('/export/attendance', export_attendance)
@@ -0,0 +1,57 @@
+"""
+출석 데이터 Redis 키 스키마
+
+Redis Cluster에서도 동작하도록 이벤트별 키에 해시 태그({message_id})를 붙여
+한 이벤트의 데이터(이벤트 정보, 응답)가 항상 같은 슬롯에 놓이게 합니다.
+키 패턴 SCAN 대신 생성 시각 순으로 정렬된 인덱스(sorted set)로 이벤트를 찾습니다.
+"""
+from datetime import datetime
+
+# 현재 키 스키마 버전 (migrations.run_migrations가 이 버전까지 올림)
+SCHEMA_VERSION = 2
+
+SCHEMA_VERSION_KEY = "attendance:{meta}:schema_version"
+
+# 모든 점수가 0인 sorted set. 멤버가 "생성시각(ms, 13자리):message_id" 이므로
+# BYLEX 범위 조회로 날짜 구간 조회와 커서 페이지네이션을 할 수 있습니다.
+EVENT_INDEX_KEY = "attendance:{index}:events"
+
+
+def event_key(message_id: int) -> str:
+    return f"attendance:{{{message_id}}}:event"
+
+
+def responses_key(message_id: int) -> str:
+    return f"attendance:{{{message_id}}}:responses"
+
+
+def index_member(created_at: datetime, message_id: int) -> str:
+    """
+    이벤트 인덱스 멤버를 만듭니다.
+
+    Args:
+        created_at: 이벤트 생성 시각
+        message_id: 메시지 ID
+
+    Returns:
+        "1700000000000:123456" 형태의 문자열 (사전순 = 생성 시각순)
+    """
+    return f"{index_bound(created_at)}:{message_id}"
+
+
+def index_bound(at: datetime) -> str:
+    """
+    인덱스 BYLEX 범위 조회에 쓸 시각 경계값을 만듭니다.
+
+    Args:
+        at: 기준 시각
+
+    Returns:
+        13자리 밀리초 타임스탬프 문자열
+    """
+    return f"{int(at.timestamp() * 1000):013d}"
+
+
+def message_id_of(member: str) -> int:
+    """인덱스 멤버에서 메시지 ID를 꺼냅니다."""
+    return int(member.rsplit(":", 1)[1])
@@ -0,0 +1,157 @@
+import logging
+from datetime import datetime
+
+from ..database.redis import redis_client
+from . import keys
+from .repository import pack_response
+
+logger = logging.getLogger('hillkeeper')
+
+LEGACY_RESPONSE_PATTERN = "attendance:response:*:*"
+COMPACT_RESPONSE_PATTERN = "attendance:responses:*"
+DATED_EVENT_PATTERN = "attendance:event:*"
+
+
+async def migrate_compact_responses(*, batch_size: int = 500) -> int:
+    """
+    (v1) 사용자별 응답 키를 메시지별 압축 해시로 옮깁니다.
+    `attendance:response:{message_id}:{user_id}` 해시를 읽어
+    `attendance:responses:{message_id}` 해시의 `user_id -> "response|epoch"` 필드로 합치고,
+    남은 TTL 중 가장 긴 값을 새 키에 적용한 뒤 기존 키를 삭제합니다.
+
+    Args:
+        batch_size: SCAN 한 번에 가져올 키 개수 (기본값: 500)
+
+    Returns:
+        옮긴 응답 개수
+    """
+    client = redis_client.client
+    migrated = 0
+
+    async for key in client.scan_iter(match=LEGACY_RESPONSE_PATTERN, count=batch_size):
+        # "attendance:response:123456:7890" -> 123456, 7890
+        _, _, message_id, user_id = key.split(":")
+
+        data = await client.hgetall(key)
+        if not data:
+            continue
+
+        epoch = int(datetime.fromisoformat(data["timestamp"]).timestamp())
+        new_key = f"attendance:responses:{message_id}"
+        ttl = await client.ttl(key)
+        current_ttl = await client.ttl(new_key)
+
+        # 기존 키와 새 키는 슬롯이 다를 수 있으므로(Redis Cluster) 트랜잭션 없이 실행
+        pipe = client.pipeline(transaction=False)
+        pipe.hset(new_key, user_id, pack_response(data["response"], epoch))
+        # 메시지의 응답 중 가장 늦게 만료되는 TTL을 유지
+        if ttl > 0 and ttl > current_ttl:
+            pipe.expire(new_key, ttl)
+        pipe.delete(key)
+        await pipe.execute()
+
+        migrated += 1
+
+    logger.info(f"Migrated {migrated} legacy responses to compact layout")
+    return migrated
+
+
+async def _move_hash(old_key: str, new_key: str, *, extra: dict | None = None) -> dict:
+    """해시를 TTL과 함께 새 키로 옮깁니다. (슬롯이 달라도 되도록 RENAME 대신 복사 후 삭제)"""
+    client = redis_client.client
+    data = await client.hgetall(old_key)
+    if not data:
+        return {}
+
+    data.update(extra or {})
+    ttl = await client.ttl(old_key)
+
+    pipe = client.pipeline(transaction=False)
+    pipe.hset(new_key, mapping=data)
+    if ttl > 0:
+        pipe.expire(new_key, ttl)
+    pipe.delete(old_key)
+    await pipe.execute()
+    return data
+
+
+async def migrate_hash_tagged_keys(*, batch_size: int = 500) -> int:
+    """
+    (v2) 이벤트/응답 키를 해시 태그 스키마로 옮기고 이벤트 인덱스를 만듭니다.
+    `attendance:event:{date}:{message_id}` -> `attendance:{message_id}:event` (+ date 필드, 인덱스 등록)
+    `attendance:responses:{message_id}` -> `attendance:{message_id}:responses`
+    키 패턴 SCAN은 이 일회성 마이그레이션에서만 사용합니다.
+
+    Args:
+        batch_size: SCAN 한 번에 가져올 키 개수 (기본값: 500)
+
+    Returns:
+        옮긴 이벤트 개수
+    """
+    client = redis_client.client
+    migrated = 0
+
+    async for key in client.scan_iter(match=DATED_EVENT_PATTERN, count=batch_size):
+        # "attendance:event:2024-01-15:123456" -> 2024-01-15, 123456
+        _, _, date, message_id = key.split(":")
+
+        data = await _move_hash(key, keys.event_key(int(message_id)), extra={"date": date})
+        if not data:
+            continue
+
+        created_at = datetime.fromisoformat(data["created_at"])
+        await client.zadd(keys.EVENT_INDEX_KEY, {keys.index_member(created_at, int(message_id)): 0})
+        migrated += 1
+
+    async for key in client.scan_iter(match=COMPACT_RESPONSE_PATTERN, count=batch_size):
+        # "attendance:responses:123456" -> 123456
+        message_id = int(key.split(":")[-1])
+        await _move_hash(key, keys.responses_key(message_id))
+
+    logger.info(f"Migrated {migrated} events to hash-tagged key schema")
+    return migrated
+
+
+# (버전, 마이그레이션) - 버전 순서대로 한 번씩 적용됩니다.
+MIGRATIONS = [
+    (1, migrate_compact_responses),
+    (2, migrate_hash_tagged_keys),
+]
+
+
+async def get_schema_version() -> int:
+    """
+    현재 Redis에 적용된 키 스키마 버전을 반환합니다.
+
+    Returns:
+        스키마 버전 (기록이 없으면 0)
+    """
+    version = await redis_client.client.get(keys.SCHEMA_VERSION_KEY)
+    return int(version) if version else 0
+
+
+async def run_migrations() -> int:
+    """
+    아직 적용되지 않은 마이그레이션을 버전 순서대로 실행합니다.
+    각 마이그레이션이 끝날 때마다 버전을 기록하므로 중간에 실패해도 다음 실행에서 이어갑니다.
+
+    Returns:
+        실행 후 스키마 버전
+
+    Raises:
+        RuntimeError: 이 코드가 모르는(더 높은) 스키마 버전일 경우
+    """
+    version = await get_schema_version()
+
+    for target, migration in MIGRATIONS:
+        if target <= version:
+            continue
+        logger.info(f"Running attendance schema migration v{target}")
+        await migration()
+        await redis_client.client.set(keys.SCHEMA_VERSION_KEY, target)
+        version = target
+
+    if version != keys.SCHEMA_VERSION:
+        raise RuntimeError(f"Unknown attendance schema version: {version} (expected {keys.SCHEMA_VERSION})")
+
+    return version
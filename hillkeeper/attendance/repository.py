@@ -1,67 +1,142 @@
 import logging
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 
 from ..config import KST
 from ..database.redis import redis_client
+from . import keys
 
 logger = logging.getLogger('hillkeeper')
 
 TTL_7_DAYS = 604800  # 7 days
 
+# Redis에 저장되기 전, 메시지 ID가 정해진 직후부터 반응을 받기 위한 이벤트 (message_id -> 이벤트 데이터)
+_pending_events: dict[int, dict] = {}
 
-async def save_event(message_id: int, *, channel_id: int, role_id: int, ttl: int = TTL_7_DAYS):
+
+def pack_response(response: str, epoch: int) -> str:
     """
-    출석 체크 이벤트를 저장합니다.
-    메시지 정보와 함께 출석 이벤트를 Redis에 저장하고 TTL을 설정합니다.
+    응답과 응답 시각을 하나의 해시 값으로 압축합니다.
+
+    Args:
+        response: 응답 유형 ("yes" 또는 "no")
+        epoch: 응답 시각 (Unix timestamp, 초)
+
+    Returns:
+        "yes|1700000000" 형태의 문자열
+    """
+    return f"{response}|{epoch}"
+
+
+def unpack_response(packed: str) -> tuple[str, datetime]:
+    """
+    압축된 응답 값을 (응답, 응답 시각) 으로 풀어냅니다.
+
+    Args:
+        packed: pack_response로 만든 문자열
+
+    Returns:
+        (response, KST 기준 datetime) 튜플
+    """
+    response, epoch = packed.split("|", 1)
+    return response, datetime.fromtimestamp(int(epoch), KST)
+
+
+def _response_record(user_id: str, packed: str) -> dict:
+    response, timestamp = unpack_response(packed)
+    return {
+        "user_id": user_id,
+        "response": response,
+        "timestamp": timestamp.isoformat()
+    }
+
+
+def register_event(message_id: int, *, channel_id: int, role_id: int, mode: str = "reaction") -> dict:
+    """
+    출석 체크 이벤트를 프로세스 안에 즉시 등록합니다.
+    Redis 저장이 끝나기 전에도 get_event로 조회되므로, 메시지가 보이는 순간부터 반응을 받을 수 있습니다.
+    등록된 이벤트는 save_event가 끝나면 정리됩니다.
 
     Args:
         message_id: 디스코드 메시지 ID
         channel_id: 채널 ID
         role_id: 멘션할 역할 ID
-        ttl: 만료 시간(초) (기본값: 7일)
+        mode: 응답 방식 ("reaction" 또는 "button")
+
+    Returns:
+        등록된 이벤트 데이터
     """
     now = datetime.now(KST)
-    date = now.date()
-
-    key = f"attendance:event:{date}:{message_id}"
-    await redis_client.client.hset(
-        key,
-        mapping={
-            "message_id": str(message_id),
-            "channel_id": str(channel_id),
-            "role_id": str(role_id),
-            "created_at": now.isoformat()
-        }
-    )
-    await redis_client.client.expire(key, ttl)
-    logger.info(f"Stored attendance event: {date}:{message_id} (ttl={ttl}s)")
+    data = {
+        "message_id": str(message_id),
+        "channel_id": str(channel_id),
+        "role_id": str(role_id),
+        "mode": mode,
+        "date": now.date().isoformat(),
+        "created_at": now.isoformat()
+    }
+    _pending_events[message_id] = data
+    return data
+
+
+def pending_event_count() -> int:
+    """
+    아직 Redis에 저장되지 않은 이벤트 개수를 반환합니다.
+
+    Returns:
+        register_event 후 save_event가 끝나지 않은 이벤트 수
+    """
+    return len(_pending_events)
 
 
-async def save_response(message_id: int, user_id: int, *, username: str, response: str):
+async def save_event(message_id: int, *, channel_id: int, role_id: int, ttl: int = TTL_7_DAYS):
+    """
+    출석 체크 이벤트를 저장합니다.
+    메시지 정보와 함께 출석 이벤트를 Redis에 저장하고 TTL을 설정한 뒤, 이벤트 인덱스에 추가합니다.
+    register_event로 먼저 등록한 이벤트가 있으면 그 데이터를 그대로 저장합니다.
+
+    Args:
+        message_id: 디스코드 메시지 ID
+        channel_id: 채널 ID
+        role_id: 멘션할 역할 ID
+        ttl: 만료 시간(초) (기본값: 7일)
+    """
+    data = _pending_events.get(message_id) or register_event(message_id, channel_id=channel_id, role_id=role_id)
+    created_at = datetime.fromisoformat(data["created_at"])
+    # 인덱스는 이벤트 키와 다른 슬롯이므로 트랜잭션 없이 파이프라인으로 전송
+    cutoff = keys.index_bound(datetime.now(KST) - timedelta(seconds=TTL_7_DAYS))
+
+    key = keys.event_key(message_id)
+    try:
+        pipe = redis_client.client.pipeline(transaction=False)
+        pipe.hset(key, mapping=data)
+        pipe.expire(key, ttl)
+        pipe.zadd(keys.EVENT_INDEX_KEY, {keys.index_member(created_at, message_id): 0})
+        # 키가 모두 만료된 오래된 인덱스 항목 정리
+        pipe.zremrangebylex(keys.EVENT_INDEX_KEY, "-", f"({cutoff}")
+        await pipe.execute()
+    finally:
+        _pending_events.pop(message_id, None)
+    logger.info(f"Stored attendance event: {data['date']}:{message_id} (ttl={ttl}s)")
+
+
+async def save_response(message_id: int, user_id: int, *, response: str):
     """
     사용자 응답을 저장합니다.
-    출석 체크 메시지에 대한 사용자의 이모지 반응을 Redis에 저장합니다.
+    메시지별 응답 해시 하나에 `user_id -> "response|epoch"` 형태로 압축해 저장합니다.
+    사용자 표시 이름은 저장하지 않고 조회 시점에 길드 멤버 캐시에서 가져옵니다.
 
     Args:
         message_id: 디스코드 메시지 ID
         user_id: 사용자 ID
-        username: 사용자 표시 이름
         response: 응답 유형 ("yes" 또는 "no")
     """
-    now = datetime.now(KST)
-
-    key = f"attendance:response:{message_id}:{user_id}"
-    await redis_client.client.hset(
-        key,
-        mapping={
-            "user_id": str(user_id),
-            "username": username,
-            "response": response,  # "yes" or "no"
-            "timestamp": now.isoformat()
-        }
-    )
-    # 7일 후 자동 삭제
-    await redis_client.client.expire(key, TTL_7_DAYS)
+    key = keys.responses_key(message_id)
+    pipe = redis_client.client.pipeline(transaction=False)
+    pipe.hset(key, str(user_id), pack_response(response, int(time.time())))
+    # 7일 후 자동 삭제 (메시지 단위 TTL)
+    pipe.expire(key, TTL_7_DAYS)
+    await pipe.execute()
     logger.info(f"Stored user response: {user_id} -> {response} for message {message_id}")
 
 
@@ -72,16 +147,42 @@ async def get_today_messages() -> list[int]:
     Returns:
         오늘 날짜의 출석 메시지 ID 리스트
     """
-    date = datetime.now(KST).date()
-    pattern = f"attendance:event:{date}:*"
+    start = datetime.now(KST).replace(hour=0, minute=0, second=0, microsecond=0)
+    return await get_messages_between(start, start + timedelta(days=1))
+
+
+async def get_messages_between(start: datetime, end: datetime) -> list[int]:
+    """
+    기간 내 생성되어 아직 만료되지 않은 출석 체크 메시지 ID 목록을 반환합니다.
+    이벤트 인덱스를 범위 조회하고, 키가 이미 만료된 항목은 인덱스에서 지웁니다.
+
+    Args:
+        start: 시작 시각 (포함)
+        end: 종료 시각 (제외)
+
+    Returns:
+        생성 시각 오름차순 메시지 ID 리스트
+    """
+    client = redis_client.client
+    members = await client.zrange(
+        keys.EVENT_INDEX_KEY,
+        f"[{keys.index_bound(start)}",
+        f"({keys.index_bound(end)}",
+        bylex=True
+    )
+    if not members:
+        return []
+
+    pipe = client.pipeline(transaction=False)
+    for member in members:
+        pipe.exists(keys.event_key(keys.message_id_of(member)))
+    exists = await pipe.execute()
 
-    message_ids = []
-    async for key in redis_client.client.scan_iter(match=pattern):
-        # "attendance:event:2024-01-15:123456" -> 123456
-        message_id = int(key.split(":")[-1])
-        message_ids.append(message_id)
+    expired = [member for member, alive in zip(members, exists) if not alive]
+    if expired:
+        await client.zrem(keys.EVENT_INDEX_KEY, *expired)
 
-    return message_ids
+    return [keys.message_id_of(member) for member, alive in zip(members, exists) if alive]
 
 
 async def get_event(message_id: int, date: datetime.date = None) -> dict | None:
@@ -95,13 +196,17 @@ async def get_event(message_id: int, date: datetime.date = None) -> dict | None:
     Returns:
         이벤트 데이터 딕셔너리. 존재하지 않으면 None
     """
+    today = datetime.now(KST).date()
     if date is None:
-        date = datetime.now(KST).date()
+        date = today
 
-    key = f"attendance:event:{date}:{message_id}"
-    data = await redis_client.client.hgetall(key)
+    pending = _pending_events.get(message_id)
+    if pending and date == today:
+        return pending
 
-    if not data:
+    data = await redis_client.client.hgetall(keys.event_key(message_id))
+
+    if not data or data.get("date") != date.isoformat():
         return None
 
     return data
@@ -115,19 +220,68 @@ async def get_responses(message_id: int) -> list[dict]:
         message_id: 메시지 ID
 
     Returns:
-        사용자 응답 데이터 리스트
+        사용자 응답 데이터 리스트 (user_id, response, timestamp)
     """
-    pattern = f"attendance:response:{message_id}:*"
+    data = await redis_client.client.hgetall(keys.responses_key(message_id))
 
-    responses = []
-    async for key in redis_client.client.scan_iter(match=pattern):
-        data = await redis_client.client.hgetall(key)
-        if data:
-            responses.append(data)
+    responses = [_response_record(user_id, packed) for user_id, packed in data.items()]
 
     return responses
 
 
+async def scan_events(cursor: str = "", *, count: int = 100) -> tuple[str, list[dict]]:
+    """
+    출석 이벤트를 생성 시각 순으로 한 페이지씩 조회합니다.
+    이벤트 인덱스를 커서(마지막으로 읽은 인덱스 멤버) 다음부터 읽으므로
+    기록이 많아도 메모리 사용량이 일정하고, 페이지 사이에 항목이 정리되어도 건너뛰지 않습니다.
+
+    Args:
+        cursor: 이전 호출이 반환한 커서 (처음에는 빈 문자열)
+        count: 한 페이지의 최대 이벤트 수 (기본값: 100)
+
+    Returns:
+        (다음 커서, 이벤트 데이터 리스트) 튜플. 다음 커서가 빈 문자열이면 끝입니다.
+    """
+    client = redis_client.client
+    members = await client.zrange(
+        keys.EVENT_INDEX_KEY,
+        f"({cursor}" if cursor else "-",
+        "+",
+        bylex=True,
+        offset=0,
+        num=count
+    )
+    if not members:
+        return "", []
+
+    pipe = client.pipeline(transaction=False)
+    for member in members:
+        pipe.hgetall(keys.event_key(keys.message_id_of(member)))
+
+    events = [data for data in await pipe.execute() if data]
+    next_cursor = members[-1] if len(members) == count else ""
+    return next_cursor, events
+
+
+async def scan_responses(message_id: int, cursor: int = 0, *, count: int = 100) -> tuple[int, list[dict]]:
+    """
+    특정 메시지의 응답을 HSCAN 커서 단위로 한 페이지씩 조회합니다.
+
+    Args:
+        message_id: 메시지 ID
+        cursor: 이전 호출이 반환한 커서 (처음에는 0)
+        count: 한 번에 훑을 필드 개수 힌트 (기본값: 100)
+
+    Returns:
+        (다음 커서, 사용자 응답 데이터 리스트) 튜플. 다음 커서가 0이면 끝입니다.
+    """
+    cursor, data = await redis_client.client.hscan(keys.responses_key(message_id), cursor, count=count)
+
+    responses = [_response_record(user_id, packed) for user_id, packed in data.items()]
+
+    return cursor, responses
+
+
 async def delete_event(message_id: int, date: datetime.date = None):
     """
     특정 이벤트를 삭제합니다.
@@ -136,11 +290,15 @@ async def delete_event(message_id: int, date: datetime.date = None):
         message_id: 메시지 ID
         date: 조회할 날짜 (기본값: 오늘)
     """
-    if date is None:
-        date = datetime.now(KST).date()
-
-    key = f"attendance:event:{date}:{message_id}"
-    await redis_client.client.delete(key)
-    logger.info(f"Deleted attendance event: {date}:{message_id}")
+    event = await get_event(message_id, date)
+    if not event:
+        return
+
+    created_at = datetime.fromisoformat(event["created_at"])
+    pipe = redis_client.client.pipeline(transaction=False)
+    pipe.delete(keys.event_key(message_id))
+    pipe.zrem(keys.EVENT_INDEX_KEY, keys.index_member(created_at, message_id))
+    await pipe.execute()
+    logger.info(f"Deleted attendance event: {event['date']}:{message_id}")
 
 
@@ -1,17 +1,63 @@
+import asyncio
 import logging
+import time
+from typing import Callable
+
+import discord
 
 from ..config import EMOJI_CHECK, EMOJI_CROSS, get_env
+from ..diagnostics import timed
 from ..messages import create_morning_check_embed, create_evening_reminder_embed, create_no_participants_embed
+from ..roles import role_index
 from ..utils import get_users_who_reacted
 from . import repository
 
 logger = logging.getLogger('hillkeeper')
 
 
-async def send_morning_check(bot, channel_id: str, role_id: str, *, is_test: bool = False):
+async def _add_attendance_reactions(message):
+    """✅/❌ 이모지를 순서대로 추가합니다. (같은 채널의 반응 요청은 Discord rate limit 버킷을 공유)"""
+    await message.add_reaction(EMOJI_CHECK)
+    await message.add_reaction(EMOJI_CROSS)
+
+
+async def _get_members_who_attended(guild, message_id: int, role) -> set:
+    """
+    저장된 응답 중 참석("yes")한 멤버를 반환합니다. (버튼 방식)
+
+    Args:
+        guild: 길드 인스턴스
+        message_id: 출석 체크 메시지 ID
+        role: 이 역할을 가진 멤버만 포함
+
+    Returns:
+        참석한 멤버 집합
+    """
+    members = set()
+    for response in await repository.get_responses(message_id):
+        if response["response"] != "yes" or not role_index.has_role(int(response["user_id"]), role):
+            continue
+        member = guild.get_member(int(response["user_id"]))
+        if member and not member.bot:
+            members.add(member)
+    return members
+
+
+@timed('service.send_morning_check')
+async def send_morning_check(
+    bot,
+    channel_id: str,
+    role_id: str,
+    *,
+    is_test: bool = False,
+    create_view: Callable[[int], discord.ui.View] | None = None
+):
     """
     아침 출석 체크 메시지를 전송합니다.
     지정된 채널에 출석 체크 메시지를 보내고 ✅/❌ 이모지를 추가합니다.
+    ATTENDANCE_MODE=button이면 이모지 대신 참석/불참 버튼을 붙입니다.
+    메시지 ID가 정해지는 즉시 이벤트를 등록해 바로 반응을 받고,
+    이모지(버튼) 추가와 Redis 저장은 동시에 진행합니다.
     테스트 모드에서는 1분 TTL, 프로덕션에서는 7일 TTL로 Redis에 저장됩니다.
 
     Args:
@@ -19,6 +65,10 @@ async def send_morning_check(bot, channel_id: str, role_id: str, *, is_test: boo
         channel_id: 메시지를 전송할 채널 ID
         role_id: 멘션할 역할 ID
         is_test: 테스트 모드 여부 (기본값: False)
+        create_view: 메시지 ID -> 버튼 View 함수 (버튼 방식일 때 필요, 예: bot.views.create_attendance_view)
+
+    Raises:
+        ValueError: 버튼 방식인데 create_view가 없을 경우
     """
     try:
         channel = bot.get_channel(int(channel_id))
@@ -27,32 +77,54 @@ async def send_morning_check(bot, channel_id: str, role_id: str, *, is_test: boo
             return
 
         voice_channel_id = get_env('VOICE_CHANNEL_ID', required=True)
-        content, embed = create_morning_check_embed(int(role_id), int(voice_channel_id))
+        # ATTENDANCE_MODE 값은 봇 시작 시(get_attendance_mode) 검증됨
+        mode = get_env('ATTENDANCE_MODE', default='reaction')
+        if mode == "button" and create_view is None:
+            raise ValueError("create_view is required when ATTENDANCE_MODE=button")
+
+        content, embed = create_morning_check_embed(
+            int(role_id),
+            int(voice_channel_id),
+            use_buttons=mode == "button"
+        )
+
+        started = time.perf_counter()
         message = await channel.send(content=content, embed=embed)
 
-        await message.add_reaction(EMOJI_CHECK)
-        await message.add_reaction(EMOJI_CROSS)
+        # 1단계: 메시지 ID가 정해지는 즉시 등록 (이 시점부터 반응을 받음)
+        repository.register_event(message.id, channel_id=channel.id, role_id=int(role_id), mode=mode)
+        live = time.perf_counter()
 
-        # Redis에 이벤트 저장 (테스트: 1분, 프로덕션: 7일)
+        # 2단계: 이모지(버튼) 추가와 Redis 저장을 동시에 진행 (테스트: 1분, 프로덕션: 7일)
+        # 버튼 custom_id에 메시지 ID가 들어가므로 전송 후 View를 붙임
         ttl = 60 if is_test else repository.TTL_7_DAYS
-        await repository.save_event(
-            message.id,
-            channel_id=channel.id,
-            role_id=int(role_id),
-            ttl=ttl
+        await asyncio.gather(
+            message.edit(view=create_view(message.id))
+            if mode == "button" else _add_attendance_reactions(message),
+            repository.save_event(
+                message.id,
+                channel_id=channel.id,
+                role_id=int(role_id),
+                ttl=ttl
+            )
         )
+        published = time.perf_counter()
 
-        logger.info(f"Morning check message sent: {message.id} (test={is_test}, ttl={ttl}s)")
+        logger.info(
+            f"Morning check message sent: {message.id} (mode={mode}, test={is_test}, ttl={ttl}s, "
+            f"live={(live - started) * 1000:.0f}ms, published={(published - started) * 1000:.0f}ms)"
+        )
 
     except Exception as e:
         logger.error(f"Failed to send morning check message: {e}")
         raise
 
 
+@timed('service.send_evening_reminder')
 async def send_evening_reminder(bot, channel_id: str, role_id: str):
     """
     저녁 리마인더 메시지를 전송합니다.
-    오늘 출석 체크에 ✅ 반응을 누른 멤버들에게 회고 모임 리마인더를 보냅니다.
+    오늘 출석 체크에 ✅ 반응(또는 참석 버튼)을 누른 멤버들에게 회고 모임 리마인더를 보냅니다.
     참여자가 없으면 안내 메시지를 전송합니다.
 
     Args:
@@ -82,20 +154,29 @@ async def send_evening_reminder(bot, channel_id: str, role_id: str):
         latest_message_id = max(message_ids)
         logger.info(f"Using latest attendance message: {latest_message_id}")
 
-        # 최신 메시지에서 참여한 멤버 수집
-        try:
-            message = await channel.fetch_message(latest_message_id)
-            participated_members = await get_users_who_reacted(
-                message,
-                EMOJI_CHECK,
-                exclude_bots=True,
-                filter_role=role
-            )
-        except Exception as e:
-            logger.error(f"Failed to fetch message {latest_message_id}: {e}")
-            # 실패한 메시지는 Redis에서 삭제
-            await repository.delete_event(latest_message_id)
-            raise ValueError(f"Failed to fetch attendance message: {latest_message_id}") from e
+        # 버튼 방식은 저장된 응답에서 참여한 멤버 수집
+        event = await repository.get_event(latest_message_id)
+        if event and event.get("mode") == "button":
+            participated_members = await _get_members_who_attended(guild, latest_message_id, role)
+        # 이모지 방식은 최신 메시지의 반응에서 참여한 멤버 수집
+        else:
+            try:
+                message = await channel.fetch_message(latest_message_id)
+                participated_members = await get_users_who_reacted(
+                    message,
+                    EMOJI_CHECK,
+                    exclude_bots=True,
+                    filter_role=role
+                )
+            except Exception as e:
+                logger.error(f"Failed to fetch message {latest_message_id}: {e}")
+                # 실패한 메시지는 Redis에서 삭제
+                await repository.delete_event(latest_message_id)
+                raise ValueError(f"Failed to fetch attendance message: {latest_message_id}") from e
+
+        # 응답하지 않은 역할 멤버 수 (저장된 응답 기준)
+        responded = [int(response["user_id"]) for response in await repository.get_responses(latest_message_id)]
+        logger.info(f"{len(role_index.non_responders(role, responded))} members with role {role.id} did not respond")
 
         # 리마인더 메시지 전송
         voice_channel_id = get_env('VOICE_CHANNEL_ID', required=True)
@@ -0,0 +1,22 @@
+"""HTTP 엔드포인트 인증"""
+import hmac
+
+from aiohttp import web
+
+
+def require_bearer_token(request: web.Request, token: str):
+    """
+    요청의 Authorization 헤더가 `Bearer <token>`인지 확인합니다.
+    바이트로 비교하므로 헤더에 ASCII가 아닌 문자(또는 잘못된 UTF-8)가 있어도 500이 아닌 401로 응답합니다.
+
+    Args:
+        request: aiohttp 요청
+        token: 기대하는 토큰
+
+    Raises:
+        web.HTTPUnauthorized: 토큰이 없거나 일치하지 않을 경우
+    """
+    # aiohttp는 잘못된 UTF-8 헤더를 surrogateescape로 디코딩하므로 같은 방식으로 되돌림
+    authorization = request.headers.get('Authorization', '').encode('utf-8', 'surrogateescape')
+    if not hmac.compare_digest(authorization, f"Bearer {token}".encode()):
+        raise web.HTTPUnauthorized()
@@ -4,6 +4,7 @@ import discord
 
 from ..config import get_env
 from ..attendance.service import send_morning_check, send_evening_reminder
+from .views import create_attendance_view
 
 logger = logging.getLogger('hillkeeper')
 
@@ -42,7 +43,7 @@ def register_commands(bot):
             channel_id = get_env('TEST_CHANNEL_ID', required=True)
             role_id = get_env('TEST_ROLE_ID', required=True)
 
-            await send_morning_check(bot, channel_id, role_id, is_test=True)
+            await send_morning_check(bot, channel_id, role_id, is_test=True, create_view=create_attendance_view)
             await interaction.followup.send(
                 "✅ Morning check test completed! Check the test channel. (Auto-delete in 1 minute)",
                 ephemeral=True
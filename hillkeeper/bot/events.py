@@ -3,6 +3,9 @@ import logging
 
 from ..config import EMOJI_CHECK, EMOJI_CROSS
 from ..attendance import repository
+from ..diagnostics import timed
+from ..roles import role_index
+from ..runtime import freeze_heap
 
 logger = logging.getLogger('hillkeeper')
 
@@ -15,14 +18,47 @@ def register_events(bot):
         """봇이 준비되었을 때 실행됩니다."""
         logger.info(f'Bot is ready: {bot.user}')
         logger.info(f'Bot ID: {bot.user.id}')
+        # 역할별 멤버 인덱스 (재연결로 다시 READY를 받으면 새로 만듦)
+        for guild in bot.guilds:
+            role_index.rebuild(guild)
+        # 멤버 캐시까지 채워진 힙을 GC 대상에서 제외 (GC_FREEZE=true, READY마다 다시 고정)
+        freeze_heap()
 
     @bot.event
+    async def on_guild_join(guild):
+        """새 길드에 참여했을 때 역할 인덱스를 만듭니다."""
+        role_index.rebuild(guild)
+
+    @bot.event
+    async def on_member_join(member):
+        """멤버가 참여했을 때 역할 인덱스에 추가합니다."""
+        role_index.add_member(member)
+
+    @bot.event
+    async def on_member_remove(member):
+        """멤버가 나갔을 때 역할 인덱스에서 제거합니다."""
+        role_index.remove_member(member)
+
+    @bot.event
+    async def on_member_update(before, after):
+        """멤버의 역할이 바뀌었을 때 역할 인덱스를 갱신합니다."""
+        if before.roles != after.roles:
+            role_index.update_member(before, after)
+
+    @bot.event
+    async def on_guild_role_delete(role):
+        """역할이 삭제되었을 때 역할 인덱스에서 제거합니다."""
+        role_index.remove_role(role)
+
+    @bot.event
+    @timed('events.on_raw_reaction_add')
     async def on_raw_reaction_add(payload):
         """이모지 반응이 추가될 때 실행됩니다."""
         await on_attendance_reaction(payload)
         # 필요시 다른 reaction handler 추가 가능
         # await on_another_reaction(payload)
 
+    @timed('events.on_attendance_reaction')
     async def on_attendance_reaction(payload):
         """
         출석 체크 메시지에 대한 이모지 반응을 처리합니다.
@@ -71,7 +107,6 @@ def register_events(bot):
         await repository.save_response(
             payload.message_id,
             payload.user_id,
-            username=member.display_name,
             response=response
         )
 
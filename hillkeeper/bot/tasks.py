@@ -4,7 +4,9 @@ import logging
 from discord.ext import tasks
 
 from ..config import KST, THURSDAY, get_env
+from ..attendance.archive import archive_closed_events
 from ..attendance.service import send_morning_check, send_evening_reminder
+from .views import create_attendance_view
 
 logger = logging.getLogger('hillkeeper')
 
@@ -31,7 +33,7 @@ def _create_morning_check_task(bot):
             logger.error("ATTENDANCE_CHANNEL_ID or RETROSPECTIVE_ROLE_ID not set")
             return
 
-        await send_morning_check(bot, channel_id, role_id)
+        await send_morning_check(bot, channel_id, role_id, create_view=create_attendance_view)
 
     @morning_check.error
     async def morning_check_error(error):
@@ -71,11 +73,31 @@ def _create_evening_reminder_task(bot):
     return evening_reminder
 
 
+def _create_archive_task():
+
+    @tasks.loop(time=datetime.time(hour=4, minute=0, tzinfo=KST))
+    async def archive():
+        """
+        매일 오전 4시에 실행되는 작업입니다.
+        마감된 출석 기록을 Redis TTL로 만료되기 전에 아카이브로 복사합니다.
+        """
+        logger.info("Starting attendance archive")
+        await archive_closed_events()
+
+    @archive.error
+    async def archive_error(error):
+        logger.error(f"Archive task failed: {error}")
+
+    return archive
+
+
 def register_tasks(bot):
     """봇에 스케줄 작업을 등록합니다."""
     bot.morning_check = _create_morning_check_task(bot)
     bot.evening_reminder = _create_evening_reminder_task(bot)
+    bot.archive = _create_archive_task()
 
     bot.morning_check.start()
     bot.evening_reminder.start()
+    bot.archive.start()
     logger.info("Tasks started successfully")
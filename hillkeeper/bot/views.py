@@ -0,0 +1,81 @@
+"""discord UI 컴포넌트 설정"""
+import logging
+import re
+
+import discord
+
+from ..config import EMOJI_CHECK, EMOJI_CROSS
+from ..attendance import repository
+from ..diagnostics import timed
+
+logger = logging.getLogger('hillkeeper')
+
+
+class AttendanceButton(
+    discord.ui.DynamicItem[discord.ui.Button],
+    template=r'attendance:(?P<response>yes|no):(?P<message_id>[0-9]+)'
+):
+    """
+    출석 체크 참석/불참 버튼.
+    custom_id에 응답 유형과 이벤트(메시지) ID를 담고 있어, 봇이 재시작되어도
+    add_dynamic_items 등록만으로 기존 메시지의 버튼 클릭을 처리할 수 있습니다.
+    """
+
+    def __init__(self, message_id: int, response: str):
+        self.message_id = message_id
+        self.response = response
+        attend = response == "yes"
+        super().__init__(
+            discord.ui.Button(
+                label="참석합니다" if attend else "불참합니다",
+                emoji=EMOJI_CHECK if attend else EMOJI_CROSS,
+                style=discord.ButtonStyle.primary if attend else discord.ButtonStyle.secondary,
+                custom_id=f"attendance:{response}:{message_id}"
+            )
+        )
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match: re.Match[str], /):
+        return cls(int(match['message_id']), match['response'])
+
+    @timed('views.attendance_button')
+    async def callback(self, interaction: discord.Interaction):
+        """
+        버튼 클릭을 처리합니다.
+        응답을 저장하고 클릭한 사용자에게만 보이는 메시지로 답합니다. (추가 REST 호출 없음)
+        """
+        event = await repository.get_event(self.message_id)
+        if not event:
+            await interaction.response.send_message("⏰ 이미 마감된 출석 체크예요.", ephemeral=True)
+            return
+
+        # 사용자별 필드 하나만 덮어쓰므로 마지막 선택만 남음
+        await repository.save_response(self.message_id, interaction.user.id, response=self.response)
+
+        if self.response == "yes":
+            await interaction.response.send_message(f"{EMOJI_CHECK} 참석으로 기록했어요.", ephemeral=True)
+        else:
+            await interaction.response.send_message(f"{EMOJI_CROSS} 불참으로 기록했어요.", ephemeral=True)
+
+        logger.info(f"User {interaction.user.display_name} ({interaction.user.id}) clicked {self.response}")
+
+
+def create_attendance_view(message_id: int) -> discord.ui.View:
+    """
+    출석 체크 메시지에 붙일 참석/불참 버튼 View를 생성합니다.
+
+    Args:
+        message_id: 출석 체크 메시지 ID (버튼 custom_id에 포함)
+
+    Returns:
+        타임아웃 없는 View
+    """
+    view = discord.ui.View(timeout=None)
+    view.add_item(AttendanceButton(message_id, "yes"))
+    view.add_item(AttendanceButton(message_id, "no"))
+    return view
+
+
+def register_views(bot):
+    """봇에 재시작 후에도 동작하는 버튼 핸들러를 등록합니다."""
+    bot.add_dynamic_items(AttendanceButton)
@@ -17,6 +17,9 @@ EMOJI_CHECK = "✅"
 EMOJI_CROSS = "❌"
 EMOJI_MIC = "🎤"
 
+# 출석 체크 방식 (ATTENDANCE_MODE)
+ATTENDANCE_MODES = ("reaction", "button")
+
 
 def get_env(key: str, *, default: str = None, required: bool = False) -> str:
     """
@@ -37,3 +40,20 @@ def get_env(key: str, *, default: str = None, required: bool = False) -> str:
     if required and not value:
         raise ValueError(f"{key} environment variable is required")
     return value
+
+
+def get_attendance_mode() -> str:
+    """
+    ATTENDANCE_MODE 환경 변수를 검증해 반환합니다.
+    봇 시작 시(setup_hook) 한 번 호출해 잘못된 값이면 배포 단계에서 실패하게 합니다.
+
+    Returns:
+        "reaction" 또는 "button" (기본값: "reaction")
+
+    Raises:
+        ValueError: ATTENDANCE_MODES에 없는 값일 경우
+    """
+    mode = get_env('ATTENDANCE_MODE', default='reaction')
+    if mode not in ATTENDANCE_MODES:
+        raise ValueError(f"ATTENDANCE_MODE must be one of {ATTENDANCE_MODES}: {mode}")
+    return mode
@@ -14,20 +14,23 @@ class RedisClient:
     """
 
     def __init__(self):
-        self._client: redis.Redis | None = None
+        self._client: redis.Redis | redis.RedisCluster | None = None
 
     async def connect(self):
         """
         Redis 서버에 연결합니다.
         REDIS_URL 환경 변수를 사용하여 연결하고 ping으로 연결을 확인합니다.
+        REDIS_CLUSTER=true이면 Redis Cluster 클라이언트로 연결합니다.
         """
         if self._client:
             logger.warning("Redis client already connected")
             return
 
         redis_url = get_env('REDIS_URL', required=True)
+        cluster = get_env('REDIS_CLUSTER', default='false').lower() == 'true'
 
-        self._client = redis.from_url(
+        factory = redis.RedisCluster.from_url if cluster else redis.from_url
+        self._client = factory(
             redis_url,
             encoding="utf-8",
             decode_responses=True
@@ -35,9 +38,12 @@ class RedisClient:
 
         try:
             await self._client.ping()
-            logger.info("Redis connected successfully")
+            logger.info(f"Redis connected successfully (cluster={cluster})")
         except Exception as e:
             logger.error(f"Failed to connect to Redis: {e}")
+            # 다음 connect() 호출에서 다시 연결을 시도할 수 있도록 정리
+            await self._client.close()
+            self._client = None
             raise
 
     async def disconnect(self):
@@ -50,7 +56,7 @@ class RedisClient:
             logger.info("Redis disconnected")
 
     @property
-    def client(self) -> redis.Redis:
+    def client(self) -> redis.Redis | redis.RedisCluster:
         """
         Redis 클라이언트 인스턴스를 반환합니다.
 
@@ -0,0 +1,112 @@
+"""sqlite archive client"""
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+from typing import Any, Callable
+
+from ..config import get_env
+
+logger = logging.getLogger('hillkeeper')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    message_id  INTEGER PRIMARY KEY,
+    date        TEXT    NOT NULL,
+    channel_id  INTEGER NOT NULL,
+    role_id     INTEGER NOT NULL,
+    created_at  TEXT    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_events_date ON events (date);
+
+CREATE TABLE IF NOT EXISTS responses (
+    message_id    INTEGER NOT NULL,
+    user_id       INTEGER NOT NULL,
+    date          TEXT    NOT NULL,
+    response      TEXT    NOT NULL,
+    responded_at  INTEGER NOT NULL,
+    PRIMARY KEY (message_id, user_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_responses_user_date ON responses (user_id, date);
+CREATE INDEX IF NOT EXISTS idx_responses_date ON responses (date);
+"""
+
+
+class SQLiteClient:
+    """
+    SQLite 아카이브 연결 관리 클래스.
+    Redis TTL로 만료되기 전의 출석 기록을 보관하는 로컬 저장소 연결을 관리합니다.
+    sqlite3는 동기 API이므로 모든 작업은 run()을 통해 스레드에서 하나씩 실행됩니다.
+    """
+
+    def __init__(self):
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def connect(self, path: str | None = None):
+        """
+        아카이브 파일을 열고 스키마를 생성합니다.
+
+        Args:
+            path: 아카이브 파일 경로 (기본값: ARCHIVE_PATH 환경 변수, 없으면 data/archive.sqlite3)
+        """
+        if self._conn:
+            logger.warning("SQLite archive already connected")
+            return
+
+        path = path or get_env('ARCHIVE_PATH', default='data/archive.sqlite3')
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        logger.info(f"SQLite archive opened: {path}")
+
+    def disconnect(self):
+        """
+        아카이브 연결을 종료합니다.
+        """
+        if self._conn:
+            self._conn.close()
+            self._conn = None
+            logger.info("SQLite archive closed")
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """
+        SQLite 연결을 반환합니다.
+
+        Returns:
+            열린 sqlite3 연결
+
+        Raises:
+            RuntimeError: 연결되지 않은 상태에서 접근 시
+        """
+        if not self._conn:
+            raise RuntimeError("SQLite archive not connected. Call connect() first.")
+        return self._conn
+
+    async def run(self, func: Callable[[sqlite3.Connection], Any]) -> Any:
+        """
+        연결을 인자로 받는 함수를 스레드에서 실행합니다.
+
+        Args:
+            func: sqlite3 연결을 받아 작업을 수행하는 함수
+
+        Returns:
+            func의 반환값
+        """
+        conn = self.connection
+
+        def call():
+            with self._lock:
+                return func(conn)
+
+        return await asyncio.to_thread(call)
+
+
+sqlite_client = SQLiteClient()
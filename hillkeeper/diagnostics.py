@@ -0,0 +1,280 @@
+"""런타임 진단 (이벤트 루프 지연, 느린 콜백, GC 일시정지, 코루틴 타이밍, 프로파일링)"""
+import asyncio
+import collections
+import functools
+import gc
+import logging
+import os
+import sys
+import threading
+import time
+
+from aiohttp import web
+
+from .auth import require_bearer_token
+from .config import get_env
+from .runtime import GCPauseRecorder
+
+logger = logging.getLogger('hillkeeper')
+
+# /debug 라우트는 공개 포트에 열리므로 Bearer 토큰이 있어야 활성화됩니다.
+TOKEN = get_env('DIAGNOSTICS_TOKEN')
+# 비활성화 상태에서는 데코레이터/라우트/샘플러 모두 설치하지 않습니다.
+REQUESTED = get_env('DIAGNOSTICS_ENABLED', default='false').lower() == 'true'
+ENABLED = REQUESTED and bool(TOKEN)
+
+LAG_INTERVAL = 0.5  # 루프 지연 샘플링 주기(초)
+# 느린 콜백 수집은 asyncio 디버그 모드(핸들마다 스택 기록, 코루틴 생성 위치 추적)가 필요해
+# 측정 대상 지연 자체를 늘리므로 따로 켭니다. 막힌 콜백은 루프 지연 샘플러로도 드러납니다.
+SLOW_CALLBACKS = get_env('DIAGNOSTICS_SLOW_CALLBACKS', default='false').lower() == 'true'
+SLOW_CALLBACK_THRESHOLD = int(get_env('DIAGNOSTICS_SLOW_CALLBACK_MS', default='100')) / 1000
+MAX_PROFILE_SECONDS = 60
+HISTORY_SIZE = 1024
+
+
+def _summary(values) -> dict:
+    """샘플(초) 목록을 밀리초 단위 요약 통계로 변환합니다."""
+    ordered = sorted(values)
+    if not ordered:
+        return {"samples": 0}
+
+    def pct(p: float) -> float:
+        return round(ordered[min(int(p * len(ordered)), len(ordered) - 1)] * 1000, 2)
+
+    return {
+        "samples": len(ordered),
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 2),
+        "p50_ms": pct(0.50),
+        "p95_ms": pct(0.95),
+        "p99_ms": pct(0.99),
+        "max_ms": round(ordered[-1] * 1000, 2),
+    }
+
+
+class _Timing:
+    """코루틴 하나의 호출 횟수, 에러 수, 최근 실행 시간을 보관합니다."""
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.recent = collections.deque(maxlen=HISTORY_SIZE)
+
+
+_timings: dict[str, _Timing] = collections.defaultdict(_Timing)
+
+
+def timed(name: str):
+    """
+    코루틴 실행 시간을 기록하는 데코레이터.
+    진단이 꺼져 있으면 원래 함수를 그대로 반환하므로 오버헤드가 없습니다.
+
+    Args:
+        name: /debug/timings 에 표시할 이름 (예: "events.on_raw_reaction_add")
+    """
+    def decorator(func):
+        if not ENABLED:
+            return func
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            timing = _timings[name]
+            started = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            except BaseException:
+                timing.errors += 1
+                raise
+            finally:
+                timing.count += 1
+                timing.recent.append(time.perf_counter() - started)
+
+        return wrapper
+
+    return decorator
+
+
+class _SlowCallbackHandler(logging.Handler):
+    """asyncio 디버그 모드의 'Executing ... took ... seconds' 경고를 수집합니다."""
+
+    def __init__(self):
+        super().__init__(level=logging.WARNING)
+        self.records = collections.deque(maxlen=HISTORY_SIZE)
+
+    def emit(self, record: logging.LogRecord):
+        if not isinstance(record.msg, str) or not record.msg.startswith('Executing') or len(record.args) != 2:
+            return
+        handle, duration = record.args
+        self.records.append({
+            "at": record.created,
+            "callback": str(handle),
+            "duration_ms": round(duration * 1000, 2),
+        })
+
+
+class _LoopMonitor:
+    """이벤트 루프 지연 샘플러, 느린 콜백 수집기, GC 일시정지 기록기."""
+
+    def __init__(self):
+        self.lag = collections.deque(maxlen=HISTORY_SIZE)
+        self.slow_callbacks = _SlowCallbackHandler()
+        self.gc_pauses = GCPauseRecorder(maxlen=HISTORY_SIZE)
+        self.loop_thread_id: int | None = None
+        self._task: asyncio.Task | None = None
+
+    def start(self):
+        loop = asyncio.get_running_loop()
+        self.loop_thread_id = threading.get_ident()
+
+        if SLOW_CALLBACKS:
+            loop.set_debug(True)
+            loop.slow_callback_duration = SLOW_CALLBACK_THRESHOLD
+            logging.getLogger('asyncio').addHandler(self.slow_callbacks)
+        self.gc_pauses.start()
+
+        self._task = asyncio.create_task(self._sample_lag())
+        if SLOW_CALLBACKS:
+            logger.info(f"Diagnostics enabled (slow callback threshold={SLOW_CALLBACK_THRESHOLD * 1000:.0f}ms)")
+        else:
+            logger.info("Diagnostics enabled (slow callback tracking off)")
+
+    async def stop(self):
+        if SLOW_CALLBACKS:
+            asyncio.get_running_loop().set_debug(False)
+            logging.getLogger('asyncio').removeHandler(self.slow_callbacks)
+        self.gc_pauses.stop()
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    async def _sample_lag(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + LAG_INTERVAL
+            await asyncio.sleep(LAG_INTERVAL)
+            self.lag.append(max(loop.time() - expected, 0.0))
+
+
+_monitor = _LoopMonitor()
+_profile_lock = threading.Lock()
+
+
+def _frame_name(frame) -> str:
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}:{code.co_firstlineno}"
+
+
+def capture_profile(thread_id: int, seconds: float, interval: float) -> str:
+    """
+    지정한 스레드의 콜스택을 주기적으로 샘플링해 collapsed-stack 형식으로 반환합니다.
+    결과는 flamegraph.pl / speedscope 등에 바로 넣을 수 있습니다.
+
+    Args:
+        thread_id: 샘플링할 스레드 ID (이벤트 루프 스레드)
+        seconds: 샘플링 시간(초)
+        interval: 샘플링 주기(초)
+
+    Returns:
+        "root;child;leaf count" 형태의 줄 목록 문자열
+    """
+    stacks = collections.Counter()
+    deadline = time.monotonic() + seconds
+
+    while time.monotonic() < deadline:
+        frame = sys._current_frames().get(thread_id)
+        stack = []
+        while frame is not None:
+            stack.append(_frame_name(frame))
+            frame = frame.f_back
+        if stack:
+            stacks[";".join(reversed(stack))] += 1
+        time.sleep(interval)
+
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+
+
+async def loop_stats(request: web.Request) -> web.Response:
+    return web.json_response({
+        "lag": _summary(_monitor.lag),
+        "slow_callbacks_enabled": SLOW_CALLBACKS,
+        "slow_callback_threshold_ms": SLOW_CALLBACK_THRESHOLD * 1000,
+        "slow_callbacks": list(_monitor.slow_callbacks.records)[-50:],
+        "tasks": len(asyncio.all_tasks()),
+        "gc": {
+            "thresholds": gc.get_threshold(),
+            "frozen": gc.get_freeze_count(),
+            "pauses": {
+                f"gen{generation}": _summary(pauses)
+                for generation, pauses in _monitor.gc_pauses.pauses.items()
+            },
+        },
+    })
+
+
+async def timing_stats(request: web.Request) -> web.Response:
+    return web.json_response({
+        name: {"count": timing.count, "errors": timing.errors, **_summary(timing.recent)}
+        for name, timing in sorted(_timings.items())
+    })
+
+
+async def profile(request: web.Request) -> web.Response:
+    """?seconds=10&interval_ms=5 동안 이벤트 루프 스레드를 프로파일링합니다."""
+    try:
+        seconds = min(float(request.query.get('seconds', 10)), MAX_PROFILE_SECONDS)
+        interval = max(float(request.query.get('interval_ms', 5)), 1) / 1000
+    except ValueError:
+        raise web.HTTPBadRequest(text="seconds and interval_ms must be numbers")
+
+    if not _profile_lock.acquire(blocking=False):
+        raise web.HTTPConflict(text="A profile capture is already running")
+    try:
+        logger.info(f"Capturing {seconds}s profile (interval={interval * 1000:.0f}ms)")
+        collapsed = await asyncio.to_thread(capture_profile, _monitor.loop_thread_id, seconds, interval)
+    finally:
+        _profile_lock.release()
+
+    return web.Response(
+        text=collapsed,
+        headers={"Content-Disposition": 'attachment; filename="profile.collapsed"'}
+    )
+
+
+@web.middleware
+async def _require_token(request: web.Request, handler):
+    """/debug 요청에 Authorization: Bearer <DIAGNOSTICS_TOKEN>을 요구합니다."""
+    if request.path.startswith('/debug/'):
+        require_bearer_token(request, TOKEN)
+    return await handler(request)
+
+
+async def _on_startup(app: web.Application):
+    _monitor.start()
+
+
+async def _on_cleanup(app: web.Application):
+    await _monitor.stop()
+
+
+def register_diagnostics(app: web.Application):
+    """
+    진단용 /debug 라우트를 등록하고 루프 모니터를 시작합니다.
+    DIAGNOSTICS_ENABLED가 true가 아니거나 DIAGNOSTICS_TOKEN이 없으면 아무것도 하지 않습니다.
+
+    GET /debug/loop, /debug/timings, /debug/profile
+    Authorization: Bearer <DIAGNOSTICS_TOKEN>
+
+    Args:
+        app: aiohttp 애플리케이션
+    """
+    if REQUESTED and not TOKEN:
+        logger.warning("DIAGNOSTICS_ENABLED is set but DIAGNOSTICS_TOKEN is missing, diagnostics disabled")
+    if not ENABLED:
+        return
+
+    app.middlewares.append(_require_token)
+
+    app.router.add_get('/debug/loop', loop_stats)
+    app.router.add_get('/debug/timings', timing_stats)
+    app.router.add_get('/debug/profile', profile)
+    app.on_startup.append(_on_startup)
+    app.on_cleanup.append(_on_cleanup)
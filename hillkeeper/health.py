@@ -0,0 +1,168 @@
+"""헬스 체크 (Redis, Discord 게이트웨이, 스케줄러, 쓰기 대기열)"""
+import asyncio
+import datetime
+import logging
+import math
+import time
+
+from aiohttp import web
+
+from .attendance import repository
+from .config import get_env
+from .database.redis import redis_client
+
+logger = logging.getLogger('hillkeeper')
+
+# 프로브 요청은 캐시된 결과만 읽고, 실제 점검은 이 주기로 백그라운드에서 실행합니다.
+REFRESH_INTERVAL = int(get_env('HEALTH_REFRESH_SECONDS', default='15'))
+REDIS_TIMEOUT = 2.0
+# 게이트웨이 재연결은 흔하므로 이 시간 이상 끊겨 있을 때만 비정상으로 봅니다.
+GATEWAY_GRACE_SECONDS = 60
+# 다음 실행 예정 시각이 이만큼 지나도 돌지 않으면 스케줄러가 멈춘 것으로 봅니다.
+SCHEDULER_SLACK_SECONDS = 60
+MAX_PENDING_EVENTS = 10
+
+TASK_NAMES = ("morning_check", "evening_reminder", "archive")
+
+
+async def _check_redis() -> dict:
+    """Redis PING 왕복 시간을 측정합니다."""
+    started = time.perf_counter()
+    try:
+        await asyncio.wait_for(redis_client.client.ping(), timeout=REDIS_TIMEOUT)
+    except Exception as e:
+        return {"ok": False, "error": str(e) or type(e).__name__}
+    return {"ok": True, "rtt_ms": round((time.perf_counter() - started) * 1000, 2)}
+
+
+def _check_scheduler(bot) -> dict:
+    """등록된 스케줄 작업이 실행 중이고 예정 시각을 넘기지 않았는지 확인합니다."""
+    now = datetime.datetime.now(datetime.timezone.utc)
+    tasks = {}
+
+    for name in TASK_NAMES:
+        loop = getattr(bot, name, None)
+        if loop is None:
+            tasks[name] = {"ok": False, "error": "not registered"}
+            continue
+
+        next_iteration = loop.next_iteration
+        overdue = (
+            next_iteration is not None
+            and (now - next_iteration).total_seconds() > SCHEDULER_SLACK_SECONDS
+        )
+        tasks[name] = {
+            "ok": loop.is_running() and not loop.failed() and not overdue,
+            "running": loop.is_running(),
+            "failed": loop.failed(),
+            "next_iteration": next_iteration.isoformat() if next_iteration else None,
+        }
+
+    return {"ok": all(task["ok"] for task in tasks.values()), "tasks": tasks}
+
+
+class _HealthMonitor:
+    """주기적으로 의존성을 점검하고 마지막 결과를 보관합니다."""
+
+    def __init__(self):
+        self.snapshot: dict | None = None
+        self.checked_at: float | None = None
+        self._disconnected_at: float | None = None
+        self._task: asyncio.Task | None = None
+
+    def start(self, bot):
+        self._disconnected_at = time.monotonic()
+        self._task = asyncio.create_task(self._refresh_forever(bot))
+        logger.info(f"Health refresher started (interval={REFRESH_INTERVAL}s)")
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    def _check_gateway(self, bot) -> dict:
+        """게이트웨이 연결 상태와 하트비트 지연을 확인합니다."""
+        now = time.monotonic()
+        latency = bot.latency
+        connected = bot.is_ready() and not bot.is_closed() and math.isfinite(latency)
+
+        if connected:
+            self._disconnected_at = None
+        elif self._disconnected_at is None:
+            self._disconnected_at = now
+
+        disconnected_for = now - self._disconnected_at if self._disconnected_at is not None else 0.0
+        return {
+            "ok": connected or disconnected_for < GATEWAY_GRACE_SECONDS,
+            "connected": connected,
+            "latency_ms": round(latency * 1000, 2) if math.isfinite(latency) else None,
+            "disconnected_for_s": round(disconnected_for, 1),
+        }
+
+    async def refresh(self, bot):
+        """모든 항목을 점검해 스냅샷을 갱신합니다."""
+        pending = repository.pending_event_count()
+        checks = {
+            "redis": await _check_redis(),
+            "gateway": self._check_gateway(bot),
+            "scheduler": _check_scheduler(bot),
+            "write_buffer": {"ok": pending <= MAX_PENDING_EVENTS, "pending_events": pending},
+        }
+        healthy = all(check["ok"] for check in checks.values())
+
+        if self.snapshot and self.snapshot["status"] == "ok" and not healthy:
+            failing = [name for name, check in checks.items() if not check["ok"]]
+            logger.warning(f"Health check failing: {', '.join(failing)}")
+
+        self.snapshot = {"status": "ok" if healthy else "unhealthy", "checks": checks}
+        self.checked_at = time.time()
+
+    async def _refresh_forever(self, bot):
+        while True:
+            try:
+                await self.refresh(bot)
+            except Exception as e:
+                logger.error(f"Health refresh failed: {e}")
+            await asyncio.sleep(REFRESH_INTERVAL)
+
+
+_monitor = _HealthMonitor()
+
+
+async def health_check(request: web.Request) -> web.Response:
+    """
+    캐시된 헬스 체크 결과를 반환합니다. (요청마다 Redis 등에 접근하지 않음)
+    정상이면 200, 비정상이거나 결과가 오래됐으면(리프레셔 정지) 503을 반환합니다.
+    """
+    snapshot = _monitor.snapshot
+    if snapshot is None:
+        return web.json_response({"status": "starting"}, status=503)
+
+    age = time.time() - _monitor.checked_at
+    status = snapshot["status"] if age <= REFRESH_INTERVAL * 3 else "stale"
+    body = {
+        **snapshot,
+        "status": status,
+        "checked_at": datetime.datetime.fromtimestamp(_monitor.checked_at, datetime.timezone.utc).isoformat(),
+        "age_s": round(age, 1),
+    }
+    return web.json_response(body, status=200 if status == "ok" else 503)
+
+
+def register_health(app: web.Application, bot):
+    """
+    /health 라우트를 등록하고 백그라운드 리프레셔를 시작합니다.
+
+    Args:
+        app: aiohttp 애플리케이션
+        bot: 게이트웨이/스케줄러 상태를 확인할 Discord 봇 인스턴스
+    """
+    async def on_startup(app: web.Application):
+        _monitor.start(bot)
+
+    async def on_cleanup(app: web.Application):
+        await _monitor.stop()
+
+    app.router.add_get('/health', health_check)
+    app.on_startup.append(on_startup)
+    app.on_cleanup.append(on_cleanup)
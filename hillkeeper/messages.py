@@ -3,34 +3,42 @@ import discord
 from .config import EMOJI_CHECK, EMOJI_CROSS
 
 
-def create_morning_check_embed(role_id: int, voice_channel_id: int) -> tuple[str, discord.Embed]:
+def create_morning_check_embed(role_id: int, voice_channel_id: int, *,
+                               use_buttons: bool = False) -> tuple[str, discord.Embed]:
     """
     아침 출석 체크 Embed를 생성합니다.
 
     Args:
         role_id: 멘션할 역할 ID
         voice_channel_id: 음성 채널 ID
+        use_buttons: 이모지 반응 대신 버튼으로 응답받는지 여부 (기본값: False)
 
     Returns:
         (content, embed) 튜플
     """
     content = f"<@&{role_id}>"
 
-    embed = discord.Embed(
-        title="📋️회고 모임 참석 여부 확인",
-        description=(
-            "오늘 밤 10시 회고 모임이 있어요!\n"
+    if use_buttons:
+        guide = "아래 버튼으로 참석 여부를 알려주세요."
+        footer = "⚠️ 다시 누르면 마지막 선택만 남아요."
+    else:
+        guide = (
             "참석 여부를 체크해주세요.\n"
             f"- {EMOJI_CHECK} `참석합니다`\n"
             f"- {EMOJI_CROSS} `불참합니다`"
-        ),
+        )
+        footer = "⚠️ 참석과 불참을 모두 누르면 마지막 선택만 남아요."
+
+    embed = discord.Embed(
+        title="📋️회고 모임 참석 여부 확인",
+        description=f"오늘 밤 10시 회고 모임이 있어요!\n{guide}",
         color=0x58ABFF,  # 파란색
     )
 
     embed.add_field(name="시간", value="오늘 오후 10시", inline=True)
     embed.add_field(name="채널", value=f"<#{voice_channel_id}>", inline=True)
 
-    embed.set_footer(text="⚠️ 참석과 불참을 모두 누르면 마지막 선택만 남아요.")
+    embed.set_footer(text=footer)
 
     return content, embed
 
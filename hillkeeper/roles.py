@@ -0,0 +1,110 @@
+"""역할별 멤버 인덱스"""
+import logging
+from typing import Iterable
+
+import discord
+
+logger = logging.getLogger('hillkeeper')
+
+
+class RoleIndex:
+    """
+    역할 ID -> 사용자 ID 집합 인덱스.
+    on_ready에서 길드 단위로 만들고 멤버 참여/탈퇴/역할 변경 이벤트로 갱신하므로,
+    역할 보유 여부를 멤버 객체의 역할 목록을 훑지 않고 O(1)로 확인할 수 있습니다.
+    아직 인덱스가 만들어지지 않은 길드는 discord.py 캐시로 대신 조회합니다.
+    (has_role은 해당 멤버 한 명만, members/non_responders는 role.members로 확인)
+    """
+
+    def __init__(self):
+        self._members: dict[int, set[int]] = {}
+        self._guilds: set[int] = set()
+
+    def rebuild(self, guild: discord.Guild):
+        """
+        길드의 캐시된 멤버로 인덱스를 다시 만듭니다.
+
+        Args:
+            guild: 인덱스를 만들 길드 (멤버 캐시가 채워진 상태여야 함)
+        """
+        for role in guild.roles:
+            self._members[role.id] = set()
+        for member in guild.members:
+            self.add_member(member)
+
+        self._guilds.add(guild.id)
+        logger.info(f"Role index built for guild {guild.id} ({len(guild.roles)} roles, {guild.member_count} members)")
+
+    def add_member(self, member: discord.Member):
+        """멤버가 가진 모든 역할에 멤버를 추가합니다."""
+        for role in member.roles:
+            self._members.setdefault(role.id, set()).add(member.id)
+
+    def remove_member(self, member: discord.Member):
+        """멤버가 가진 모든 역할에서 멤버를 제거합니다."""
+        for role in member.roles:
+            self._members.get(role.id, set()).discard(member.id)
+
+    def update_member(self, before: discord.Member, after: discord.Member):
+        """역할 변경 전후를 비교해 추가/제거된 역할만 반영합니다."""
+        before_roles = {role.id for role in before.roles}
+        after_roles = {role.id for role in after.roles}
+
+        for role_id in before_roles - after_roles:
+            self._members.get(role_id, set()).discard(after.id)
+        for role_id in after_roles - before_roles:
+            self._members.setdefault(role_id, set()).add(after.id)
+
+    def remove_role(self, role: discord.Role):
+        """삭제된 역할을 인덱스에서 제거합니다."""
+        self._members.pop(role.id, None)
+
+    def _member_ids(self, role: discord.Role) -> set[int]:
+        if role.guild.id not in self._guilds:
+            return {member.id for member in role.members}
+        return self._members.get(role.id, set())
+
+    def has_role(self, user_id: int, role: discord.Role) -> bool:
+        """
+        사용자가 역할을 가지고 있는지 확인합니다.
+
+        Args:
+            user_id: 사용자 ID
+            role: 확인할 역할
+
+        Returns:
+            역할 보유 여부
+        """
+        if role.guild.id not in self._guilds:
+            member = role.guild.get_member(user_id)
+            return member is not None and role in member.roles
+        return user_id in self._members.get(role.id, ())
+
+    def members(self, role: discord.Role) -> frozenset[int]:
+        """
+        역할을 가진 사용자 ID 집합을 반환합니다.
+        반환값은 복사본이므로 다른 집합과 자유롭게 연산할 수 있습니다.
+
+        Args:
+            role: 조회할 역할
+
+        Returns:
+            사용자 ID 집합
+        """
+        return frozenset(self._member_ids(role))
+
+    def non_responders(self, role: discord.Role, responded: Iterable[int]) -> set[int]:
+        """
+        역할을 가진 사용자 중 응답하지 않은 사용자 ID를 반환합니다.
+
+        Args:
+            role: 대상 역할
+            responded: 응답한 사용자 ID 목록
+
+        Returns:
+            응답하지 않은 사용자 ID 집합
+        """
+        return self._member_ids(role) - set(responded)
+
+
+role_index = RoleIndex()
@@ -0,0 +1,102 @@
+"""런타임 설정 (이벤트 루프 구현, GC 튜닝)"""
+import asyncio
+import collections
+import gc
+import logging
+import time
+from typing import Callable
+
+from .config import get_env
+
+logger = logging.getLogger('hillkeeper')
+
+# asyncio(기본) | uvloop. uvloop가 설치되어 있지 않으면 asyncio로 대체합니다.
+EVENT_LOOP = get_env('EVENT_LOOP', default='asyncio').lower()
+# true면 READY 이후 gc.freeze()로 멤버 캐시 등 시작 시점 힙을 GC 대상에서 제외합니다.
+GC_FREEZE = get_env('GC_FREEZE', default='false').lower() == 'true'
+# "700,10,10" 형식의 gc.set_threshold 값. 비어 있으면 파이썬 기본값을 사용합니다.
+GC_THRESHOLDS = get_env('GC_THRESHOLDS', default='')
+
+
+def get_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """
+    EVENT_LOOP 설정에 맞는 asyncio.run용 loop_factory를 반환합니다.
+
+    Returns:
+        uvloop.new_event_loop, 또는 기본 루프를 쓸 경우 None
+    """
+    if EVENT_LOOP != 'uvloop':
+        return None
+
+    try:
+        import uvloop
+    except ImportError:
+        logger.warning("EVENT_LOOP=uvloop but uvloop is not installed, falling back to asyncio")
+        return None
+
+    return uvloop.new_event_loop
+
+
+def configure_gc():
+    """
+    GC_THRESHOLDS 설정을 적용합니다.
+
+    Raises:
+        ValueError: GC_THRESHOLDS 형식이 잘못된 경우
+    """
+    if not GC_THRESHOLDS:
+        return
+
+    thresholds = [int(value) for value in GC_THRESHOLDS.split(',')]
+    if not 1 <= len(thresholds) <= 3:
+        raise ValueError(f"GC_THRESHOLDS must have 1 to 3 values: {GC_THRESHOLDS}")
+
+    gc.set_threshold(*thresholds)
+    logger.info(f"GC thresholds set to {gc.get_threshold()}")
+
+
+def freeze_heap() -> int:
+    """
+    GC_FREEZE=true이면 현재 힙을 정리한 뒤 gc.freeze()로 고정합니다.
+    이후 생기는 객체만 GC가 검사하므로 오래 사는 discord.py 캐시 객체를 매번 다시 훑지 않습니다.
+    세션을 새로 만들면(RESUME이 아닌 READY) discord.py가 캐시를 새 객체로 다시 만들기 때문에,
+    READY마다 기존 고정을 풀고 정리한 뒤 다시 고정합니다.
+    (풀지 않으면 순환 참조로 묶인 이전 Guild/Member 캐시가 영구 세대에 남아 해제되지 않음)
+
+    Returns:
+        고정된 객체 수 (적용하지 않았으면 0)
+    """
+    if not GC_FREEZE:
+        return 0
+
+    gc.unfreeze()
+    gc.collect()
+    gc.freeze()
+
+    count = gc.get_freeze_count()
+    logger.info(f"GC heap frozen ({count} objects)")
+    return count
+
+
+class GCPauseRecorder:
+    """gc.callbacks로 GC 실행 시간(세대별)을 기록합니다."""
+
+    def __init__(self, maxlen: int | None = 1024):
+        self.pauses: dict[int, collections.deque] = {
+            generation: collections.deque(maxlen=maxlen) for generation in range(3)
+        }
+        self._started: float | None = None
+
+    def _callback(self, phase: str, info: dict):
+        if phase == 'start':
+            self._started = time.perf_counter()
+        elif self._started is not None:
+            self.pauses[info['generation']].append(time.perf_counter() - self._started)
+            self._started = None
+
+    def start(self):
+        gc.callbacks.append(self._callback)
+
+    def stop(self):
+        if self._callback in gc.callbacks:
+            gc.callbacks.remove(self._callback)
@@ -1,6 +1,8 @@
 """유틸리티 함수"""
 import discord
 
+from .roles import role_index
+
 
 async def get_users_who_reacted(
     message: discord.Message,
@@ -12,7 +14,7 @@ async def get_users_who_reacted(
     """
     특정 이모지로 반응한 사용자 목록을 반환합니다.
     메시지의 반응을 순회하며 지정된 이모지에 반응한 멤버들을 수집합니다.
-    봇 제외 및 역할 필터링 옵션을 제공합니다.
+    봇 제외 및 역할 필터링 옵션을 제공합니다. (역할 확인은 역할 인덱스로 O(1))
 
     Args:
         message: 확인할 메시지
@@ -32,15 +34,15 @@ async def get_users_who_reacted(
                 if exclude_bots and user.bot:
                     continue
 
+                # 역할 필터링
+                if filter_role and not role_index.has_role(user.id, filter_role):
+                    continue
+
                 # Member 객체로 변환
                 member = message.guild.get_member(user.id)
                 if not member:
                     continue
 
-                # 역할 필터링
-                if filter_role and filter_role not in member.roles:
-                    continue
-
                 reacted_users.add(member)
 
     return reacted_users
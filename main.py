@@ -5,11 +5,18 @@ import discord
 from discord import app_commands
 from aiohttp import web
 
-from hillkeeper.config import get_env
+from hillkeeper.config import get_attendance_mode, get_env
+from hillkeeper.attendance.export import register_export_routes
+from hillkeeper.attendance.migrations import run_migrations
 from hillkeeper.bot.commands import register_commands
 from hillkeeper.bot.events import register_events
 from hillkeeper.bot.tasks import register_tasks
+from hillkeeper.bot.views import register_views
 from hillkeeper.database.redis import redis_client
+from hillkeeper.database.sqlite import sqlite_client
+from hillkeeper.diagnostics import register_diagnostics
+from hillkeeper.health import register_health
+from hillkeeper.runtime import configure_gc, get_loop_factory
 
 # 로깅 설정
 logging.basicConfig(
@@ -31,6 +38,10 @@ class HillkeeperBot(discord.Client):
 
     async def setup_hook(self):
         """봇 시작 시 초기화 작업을 수행합니다."""
+        # 설정 검증 (잘못된 값이면 시작 중단)
+        mode = get_attendance_mode()
+        logger.info(f"Attendance mode: {mode}")
+
         # Redis 연결 (재시도 포함)
         for attempt in range(1, 4):
             try:
@@ -43,24 +54,40 @@ class HillkeeperBot(discord.Client):
         else:
             logger.error("Failed to connect to Redis after 3 attempts")
 
+        # 출석 데이터 키 스키마를 최신 버전으로 맞춤
+        # 실패하면 읽을 수 없는 스키마로 동작하지 않도록 시작을 중단
+        try:
+            await run_migrations()
+        except Exception as e:
+            logger.error(f"Attendance schema migration failed: {e}")
+            raise
+
+        # 출석 기록 아카이브 열기
+        sqlite_client.connect()
+
         # 태스크 스케쥴링 등록
         register_tasks(self)
 
 
-async def health_check(request):
+async def liveness_check(request):
     return web.Response(text='OK')
 
 
-async def start_web_server() -> web.AppRunner:
+async def start_web_server(bot) -> web.AppRunner:
     """
     Render 포트 바인딩을 위한 웹 서버를 시작합니다.
 
+    Args:
+        bot: 헬스 체크와 내보내기(멤버 이름 조회)에 사용할 봇 인스턴스
+
     Returns:
         종료 시 정리를 위한 AppRunner 인스턴스
     """
     app = web.Application()
-    app.router.add_get('/', health_check)
-    app.router.add_get('/health', health_check)
+    app.router.add_get('/', liveness_check)
+    register_health(app, bot)
+    register_diagnostics(app)
+    register_export_routes(app, bot)
 
     port = int(os.environ.get('PORT', 8080))
     runner = web.AppRunner(app)
@@ -81,8 +108,11 @@ async def main_async():
     # 명령어 등록
     register_commands(bot)
 
+    # 버튼 핸들러 등록 (재시작 전 메시지의 버튼도 처리)
+    register_views(bot)
+
     # 웹 서버 시작 (Render 포트 바인딩용)
-    runner = await start_web_server()
+    runner = await start_web_server(bot)
 
     # 봇 실행
     token = get_env('DISCORD_TOKEN', required=True)
@@ -93,6 +123,7 @@ async def main_async():
         logger.info('Shutting down bot...')
         await bot.close()
         await redis_client.disconnect()
+        sqlite_client.disconnect()
         if runner:
             await runner.cleanup()
         logger.info('Shutdown complete')
@@ -100,7 +131,8 @@ async def main_async():
 
 def main():
     """Entry point."""
-    asyncio.run(main_async())
+    configure_gc()
+    asyncio.run(main_async(), loop_factory=get_loop_factory())
 
 
 if __name__ == '__main__':
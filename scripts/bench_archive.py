@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+출석 아카이브(SQLite) 조회 벤치마크
+
+여러 해 분량의 합성 출석 기록을 임시 아카이브에 넣고,
+사용자별/기간별 조회 시간을 측정합니다.
+
+사용법:
+  $ python scripts/bench_archive.py
+  $ python scripts/bench_archive.py --years 10 --members 200 --events-per-week 7
+
+주의:
+  - 임시 디렉터리에 아카이브를 만들고 끝나면 지웁니다 (Redis 불필요)
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+from hillkeeper.attendance import archive
+from hillkeeper.config import KST
+from hillkeeper.database.sqlite import sqlite_client
+
+
+async def populate(*, years: int, members: int, events_per_week: int, seed: int) -> tuple[int, int]:
+    """합성 이벤트/응답을 archive_events로 적재하고 (이벤트 수, 응답 수)를 반환합니다."""
+    rng = random.Random(seed)
+    start = date.today() - timedelta(days=365 * years)
+    user_ids = [200_000_000_000_000_000 + i * 7919 for i in range(members)]
+    message_id = 1_000_000_000_000_000_000
+
+    total_events = total_responses = 0
+    for week in range(years * 52):
+        events, responses = [], {}
+        for day in range(events_per_week):
+            event_date = start + timedelta(weeks=week, days=day)
+            created_at = datetime.combine(event_date, datetime.min.time(), KST) + timedelta(hours=9)
+            message_id += 1
+            events.append({
+                "message_id": str(message_id),
+                "date": event_date.isoformat(),
+                "channel_id": "1",
+                "role_id": "2",
+                "created_at": created_at.isoformat(),
+            })
+            responders = rng.sample(user_ids, k=rng.randint(members // 3, members))
+            responses[message_id] = [{
+                "user_id": str(user_id),
+                "response": "yes" if rng.random() < 0.7 else "no",
+                "timestamp": (created_at + timedelta(seconds=rng.randint(0, 12 * 3600))).isoformat(),
+            } for user_id in responders]
+            total_responses += len(responders)
+
+        await archive.archive_events(events, responses)
+        total_events += len(events)
+
+    return total_events, total_responses
+
+
+async def measure(name: str, func, repeat: int) -> dict:
+    timings, rows = [], 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = len(await func())
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return {
+        "query": name,
+        "rows": rows,
+        "mean": statistics.fmean(timings),
+        "p95": timings[min(int(0.95 * len(timings)), len(timings) - 1)],
+    }
+
+
+async def main(args: argparse.Namespace):
+    """임시 아카이브를 만들어 조회 시간을 측정합니다."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "archive.sqlite3")
+        sqlite_client.connect(path)
+        try:
+            started = time.perf_counter()
+            events, responses = await populate(
+                years=args.years,
+                members=args.members,
+                events_per_week=args.events_per_week,
+                seed=args.seed
+            )
+            load_seconds = time.perf_counter() - started
+            await sqlite_client.run(lambda conn: conn.execute("ANALYZE"))
+
+            today = date.today()
+            user_id = 200_000_000_000_000_000 + 7919 * (args.members // 2)
+            queries = [
+                ("user history (all)", lambda: archive.get_user_history(user_id)),
+                ("user history (1 year)",
+                 lambda: archive.get_user_history(user_id, start=today - timedelta(days=365), end=today)),
+                ("events between (1 month)",
+                 lambda: archive.get_events_between(today - timedelta(days=30), today)),
+                ("events between (1 year)",
+                 lambda: archive.get_events_between(today - timedelta(days=365), today)),
+                ("attendance rate (1 year)",
+                 lambda: archive.get_attendance_rate(today - timedelta(days=365), today)),
+            ]
+            results = [await measure(name, func, args.repeat) for name, func in queries]
+
+            plans = await sqlite_client.run(lambda conn: [
+                " / ".join(row["detail"] for row in conn.execute(
+                    f"EXPLAIN QUERY PLAN {sql}", params
+                ))
+                for sql, params in [
+                    ("SELECT * FROM responses WHERE user_id = ? AND date BETWEEN ? AND ?", (user_id, "0", "9")),
+                    ("SELECT * FROM events WHERE date BETWEEN ? AND ?", ("0", "9")),
+                ]
+            ])
+        finally:
+            sqlite_client.disconnect()
+        size = os.path.getsize(path) + sum(
+            os.path.getsize(path + suffix) for suffix in ("-wal", "-shm") if os.path.exists(path + suffix)
+        )
+
+    print(f"{events} events / {responses} responses over {args.years} years "
+          f"(loaded in {load_seconds:.1f}s, {size / 1024 / 1024:.1f} MiB)")
+    print(f"{'query':<28}{'rows':>8}{'mean ms':>10}{'p95 ms':>10}")
+    for r in results:
+        print(f"{r['query']:<28}{r['rows']:>8}{r['mean']:>10.2f}{r['p95']:>10.2f}")
+    print("plans:")
+    for plan in plans:
+        print(f"  {plan}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark attendance archive queries.')
+    parser.add_argument('--years', type=int, default=5)
+    parser.add_argument('--members', type=int, default=60)
+    parser.add_argument('--events-per-week', type=int, default=1, help='1 = weekly retrospective')
+    parser.add_argument('--repeat', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=0)
+
+    asyncio.run(main(parser.parse_args()))
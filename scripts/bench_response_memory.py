@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+응답 저장 구조 메모리 벤치마크
+
+기존 구조(사용자별 해시)와 압축 구조(메시지별 해시)에 같은 응답을 써넣고
+MEMORY USAGE / INFO memory 로 응답 1건당 바이트를 비교합니다.
+
+사용법:
+  # 로컬 redis-server 실행 후
+  $ REDIS_URL=redis://localhost:6379/15 python scripts/bench_response_memory.py
+  $ REDIS_URL=redis://localhost:6379/15 python scripts/bench_response_memory.py --messages 52 --users 40
+
+주의:
+  - bench: 접두사 키만 쓰고 끝나면 지웁니다. 그래도 운영 Redis에는 실행하지 마세요
+"""
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime
+
+from hillkeeper.attendance.keys import responses_key
+from hillkeeper.attendance.repository import TTL_7_DAYS, pack_response
+from hillkeeper.config import KST
+from hillkeeper.database.redis import redis_client
+
+PREFIX = "bench"
+
+
+def _sample_responses(messages: int, users: int) -> list[tuple[int, int, str, str, int]]:
+    """(message_id, user_id, username, response, epoch) 샘플을 만듭니다."""
+    rng = random.Random(0)
+    now = int(time.time())
+    base_message_id = 1_300_000_000_000_000_000
+    base_user_id = 200_000_000_000_000_000
+
+    samples = []
+    for m in range(messages):
+        for u in range(users):
+            samples.append((
+                base_message_id + m,
+                base_user_id + u * 7919,
+                f"member-{u:03d}",
+                rng.choice(["yes", "no"]),
+                now - rng.randint(0, 6 * 3600),
+            ))
+    return samples
+
+
+async def _write_legacy(samples) -> list[str]:
+    client = redis_client.client
+    keys = []
+    pipe = client.pipeline(transaction=False)
+    for message_id, user_id, username, response, epoch in samples:
+        key = f"{PREFIX}:attendance:response:{message_id}:{user_id}"
+        pipe.hset(key, mapping={
+            "user_id": str(user_id),
+            "username": username,
+            "response": response,
+            "timestamp": datetime.fromtimestamp(epoch, KST).isoformat()
+        })
+        pipe.expire(key, TTL_7_DAYS)
+        keys.append(key)
+    await pipe.execute()
+    return keys
+
+
+async def _write_compact(samples) -> list[str]:
+    client = redis_client.client
+    keys = set()
+    pipe = client.pipeline(transaction=False)
+    for message_id, user_id, _, response, epoch in samples:
+        key = f"{PREFIX}:{responses_key(message_id)}"
+        pipe.hset(key, str(user_id), pack_response(response, epoch))
+        pipe.expire(key, TTL_7_DAYS)
+        keys.add(key)
+    await pipe.execute()
+    return list(keys)
+
+
+async def _measure(name: str, writer, samples) -> dict:
+    client = redis_client.client
+    before = (await client.info("memory"))["used_memory"]
+    keys = await writer(samples)
+    after = (await client.info("memory"))["used_memory"]
+
+    pipe = client.pipeline(transaction=False)
+    for key in keys:
+        pipe.memory_usage(key, samples=0)
+    key_bytes = sum(await pipe.execute())
+
+    await client.delete(*keys)
+    return {
+        "layout": name,
+        "keys": len(keys),
+        "memory_usage": key_bytes,
+        "used_memory_delta": after - before,
+        "per_response": key_bytes / len(samples),
+        "per_response_delta": (after - before) / len(samples),
+    }
+
+
+async def main(messages: int, users: int):
+    """두 구조의 응답 1건당 메모리를 측정합니다."""
+    await redis_client.connect()
+    try:
+        samples = _sample_responses(messages, users)
+        results = [
+            await _measure("legacy (hash per user)", _write_legacy, samples),
+            await _measure("compact (hash per message)", _write_compact, samples),
+        ]
+    finally:
+        await redis_client.disconnect()
+
+    print(f"{len(samples)} responses ({messages} messages x {users} users)")
+    print(f"{'layout':<28}{'keys':>8}{'MEMORY USAGE':>14}{'B/resp':>10}{'used_memory Δ':>16}{'B/resp':>10}")
+    for r in results:
+        print(
+            f"{r['layout']:<28}{r['keys']:>8}{r['memory_usage']:>14}{r['per_response']:>10.1f}"
+            f"{r['used_memory_delta']:>16}{r['per_response_delta']:>10.1f}"
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare Redis memory per attendance response.')
+    parser.add_argument('--messages', type=int, default=20, help='number of attendance messages')
+    parser.add_argument('--users', type=int, default=30, help='responses per message')
+    args = parser.parse_args()
+
+    asyncio.run(main(args.messages, args.users))
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+런타임 설정별 반응 처리 지연 / GC 일시정지 벤치마크
+
+설정(EVENT_LOOP, GC_FREEZE, GC_THRESHOLDS)마다 replay_reactions.py를 별도 프로세스로
+실행하고(이벤트 루프와 GC 상태는 프로세스 전역이므로), --json 결과를 모아 비교합니다.
+기본값은 REST 지연과 rate limit을 끄고 큰 멤버 캐시를 올려, 핸들러 자체의 CPU 비용과
+GC 비용이 드러나도록 합니다. (부하는 처리 한계 아래로 두어 지연이 대기열 길이에 묻히지 않게 함)
+full_gc_ms는 재생 후 gc.collect() 한 번에 걸린 시간으로, 세대 2 수집 한 번의 비용입니다.
+
+사용법:
+  $ REPLAY_REDIS_URL=redis://localhost:6379/15 python scripts/bench_runtime.py
+  $ REPLAY_REDIS_URL=redis://localhost:6379/15 python scripts/bench_runtime.py --idle-members 50000 --users 2000 --runs 5
+
+주의:
+  - uvloop가 설치되어 있지 않으면 uvloop 설정은 건너뜁니다
+  - replay_reactions.py와 같이 REPLAY_REDIS_URL의 Redis만 사용합니다 (없으면 실행하지 않음)
+"""
+import argparse
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPLAY_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'replay_reactions.py')
+
+# (이름, 환경 변수)
+CONFIGURATIONS = [
+    ("asyncio", {}),
+    ("asyncio+freeze", {"GC_FREEZE": "true"}),
+    ("asyncio+thresholds", {"GC_THRESHOLDS": "50000,20,100"}),
+    ("uvloop", {"EVENT_LOOP": "uvloop"}),
+    ("uvloop+freeze", {"EVENT_LOOP": "uvloop", "GC_FREEZE": "true"}),
+    ("uvloop+freeze+thresholds", {"EVENT_LOOP": "uvloop", "GC_FREEZE": "true", "GC_THRESHOLDS": "50000,20,100"}),
+]
+
+
+def run_replay(env: dict, args: argparse.Namespace) -> dict:
+    """주어진 환경 변수로 replay_reactions.py를 한 번 실행하고 JSON 결과를 반환합니다."""
+    command = [
+        sys.executable, REPLAY_SCRIPT, '--json',
+        '--users', str(args.users),
+        '--idle-members', str(args.idle_members),
+        '--duration', str(args.duration),
+        '--speed', str(args.speed),
+        '--latency', str(args.latency),
+        '--jitter', '0',
+        '--no-rate-limits',
+        '--switch-ratio', '0.2',
+    ]
+    # 상위 프로세스의 런타임 설정이 섞이지 않도록 비운 뒤 덮어씀
+    child_env = {k: v for k, v in os.environ.items() if k not in ('EVENT_LOOP', 'GC_FREEZE', 'GC_THRESHOLDS')}
+    child_env.update(env)
+    child_env.setdefault('PYTHONPATH', os.path.dirname(os.path.dirname(REPLAY_SCRIPT)))
+
+    output = subprocess.run(command, env=child_env, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def summarize(results: list[dict]) -> dict:
+    """여러 번 실행한 결과의 중앙값을 구합니다."""
+    def median(values):
+        return round(statistics.median(values), 2)
+
+    return {
+        "p50_ms": median([r["latency_ms"]["p50"] for r in results]),
+        "p99_ms": median([r["latency_ms"]["p99"] for r in results]),
+        "max_ms": median([r["latency_ms"]["max"] for r in results]),
+        "throughput": median([r["throughput_per_s"] for r in results]),
+        "gc_count": median([sum(r["gc"][f"gen{g}"]["count"] for g in range(3)) for r in results]),
+        "gc_total_ms": median([sum(r["gc"][f"gen{g}"]["total_ms"] for g in range(3)) for r in results]),
+        "gc_max_ms": median([max(r["gc"][f"gen{g}"]["max_ms"] for g in range(3)) for r in results]),
+        "full_gc_ms": median([r["gc"]["full_collect_ms"] for r in results]),
+        "errors": sum(r["errors"] for r in results),
+    }
+
+
+def main(args: argparse.Namespace):
+    has_uvloop = importlib.util.find_spec('uvloop') is not None
+    if not has_uvloop:
+        print("uvloop is not installed, skipping uvloop configurations")
+
+    columns = ["p50_ms", "p99_ms", "max_ms", "throughput", "gc_count", "gc_total_ms", "gc_max_ms", "full_gc_ms"]
+    print(f"{'configuration':<26}" + "".join(f"{column:>12}" for column in columns))
+
+    for name, env in CONFIGURATIONS:
+        if env.get("EVENT_LOOP") == "uvloop" and not has_uvloop:
+            continue
+        summary = summarize([run_replay(env, args) for _ in range(args.runs)])
+        print(f"{name:<26}" + "".join(f"{summary[column]:>12}" for column in columns)
+              + (f"  ({summary['errors']} errors)" if summary["errors"] else ""))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare reaction latency and GC pauses across runtime settings.')
+    parser.add_argument('--users', type=int, default=750, help='members reacting')
+    parser.add_argument('--idle-members', type=int, default=20000, help='members in the cache who never react')
+    parser.add_argument('--duration', type=float, default=10.0, help='storm length in seconds')
+    parser.add_argument('--speed', type=float, default=1.0, help='replay speed multiplier (0 = as fast as possible)')
+    parser.add_argument('--latency', type=float, default=0.0, help='stub REST latency in ms')
+    parser.add_argument('--runs', type=int, default=3, help='runs per configuration (median is reported)')
+
+    main(parser.parse_args())
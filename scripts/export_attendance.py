@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+출석 데이터 내보내기
+
+Redis에 남아있는 출석 이벤트와 응답을 NDJSON 또는 CSV로 내보냅니다.
+이벤트 인덱스/HSCAN 커서로 한 페이지씩 읽어 바로 쓰므로 메모리 사용량이 일정합니다.
+(CLI에서는 Discord에 접속하지 않으므로 username은 비어 있습니다)
+
+사용법:
+  $ python scripts/export_attendance.py > attendance.ndjson
+  $ python scripts/export_attendance.py --format csv --output attendance.csv
+"""
+import argparse
+import asyncio
+import sys
+
+from hillkeeper.attendance.export import CONTENT_TYPES, iter_export
+from hillkeeper.database.redis import redis_client
+
+
+async def main(fmt: str, output: str | None, page_size: int):
+    """출석 데이터를 파일 또는 표준 출력으로 내보냅니다."""
+    await redis_client.connect()
+    out = open(output, 'w', encoding='utf-8', newline='') if output else sys.stdout
+    try:
+        async for chunk in iter_export(fmt, page_size=page_size):
+            out.write(chunk)
+    finally:
+        if output:
+            out.close()
+        await redis_client.disconnect()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Export attendance events and responses.')
+    parser.add_argument('--format', choices=list(CONTENT_TYPES), default='ndjson')
+    parser.add_argument('--output', help='output file (default: stdout)')
+    parser.add_argument('--page-size', type=int, default=100, help='events/responses per page')
+    args = parser.parse_args()
+
+    asyncio.run(main(args.format, args.output, args.page_size))
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+출석 데이터 Redis 키 스키마 마이그레이션
+
+attendance:{meta}:schema_version에 기록된 버전 이후의 마이그레이션을 순서대로 실행합니다.
+  v1: 사용자별 응답 키 -> 메시지별 압축 해시
+  v2: 해시 태그 키 스키마 + 이벤트 인덱스 (Redis Cluster 대응)
+봇도 시작할 때 같은 마이그레이션을 실행하므로, 배포 전에 미리 돌려볼 때 사용합니다.
+
+사용법:
+  $ python scripts/migrate.py
+
+주의:
+  - REDIS_URL의 실제 데이터를 변경합니다
+  - 여러 번 실행해도 안전합니다 (이미 적용된 버전은 건너뜀)
+"""
+import asyncio
+
+from hillkeeper.attendance.migrations import get_schema_version, run_migrations
+from hillkeeper.database.redis import redis_client
+
+
+async def main():
+    """적용되지 않은 스키마 마이그레이션을 실행합니다."""
+    await redis_client.connect()
+    try:
+        before = await get_schema_version()
+        after = await run_migrations()
+        print(f'✅ Schema version: v{before} -> v{after}')
+    finally:
+        await redis_client.disconnect()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,599 @@
+#!/usr/bin/env python3
+"""
+게이트웨이 반응 이벤트 재생 도구 (오프라인 부하 테스트)
+
+기록된(또는 합성한) MESSAGE_REACTION_ADD 게이트웨이 이벤트를
+register_events로 등록한 실제 핸들러에 흘려보냅니다.
+Discord REST 호출은 로컬 aiohttp 스텁 서버로 향하며, 스텁은 지연 시간과
+X-RateLimit-* 헤더 / 429 응답을 흉내냅니다.
+
+사용법:
+  # 목요일 9시 반응 폭주: 40명이 5초 동안 반응, 20%는 답을 바꿈
+  $ REPLAY_REDIS_URL=redis://localhost:6379/15 python scripts/replay_reactions.py --users 40 --duration 5
+
+  # 기록된 게이트웨이 이벤트 재생 (JSONL)
+  #   {"t": "MESSAGE_REACTION_ADD", "d": {...}, "ts": 0.125}
+  $ REPLAY_REDIS_URL=redis://localhost:6379/15 python scripts/replay_reactions.py --events reactions.jsonl
+
+  # 결과를 JSON으로 출력
+  $ python scripts/replay_reactions.py --users 100 --json
+
+  # 반응하지 않는 멤버 20000명을 캐시에 올리고 uvloop + gc.freeze 로 재생
+  $ EVENT_LOOP=uvloop GC_FREEZE=true python scripts/replay_reactions.py --idle-members 20000
+
+주의:
+  - Discord에는 접속하지 않습니다
+  - Redis는 REPLAY_REDIS_URL만 사용합니다. 설정되지 않았거나 REDIS_URL(.env 포함)과 같으면 실행하지 않습니다
+    (재생한 메시지 ID의 출석 이벤트/응답 키를 덮어쓰고 끝나면 삭제하므로, 운영 데이터를 지우지 않기 위함)
+"""
+import argparse
+import asyncio
+import collections
+import gc
+import itertools
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+import discord
+from aiohttp import web
+
+from hillkeeper.attendance import keys, repository
+from hillkeeper.bot.events import register_events
+from hillkeeper.config import EMOJI_CHECK, EMOJI_CROSS, get_env
+from hillkeeper.database.redis import redis_client
+from hillkeeper.runtime import GCPauseRecorder, configure_gc, freeze_heap, get_loop_factory
+
+BOT_USER_ID = 900000000000000001
+GUILD_ID = 910000000000000001
+CHANNEL_ID = 920000000000000001
+ROLE_ID = 930000000000000001
+BASE_MESSAGE_ID = 940000000000000001
+BASE_USER_ID = 950000000000000001
+BASE_IDLE_USER_ID = 960000000000000001
+
+# Discord 기본 한도와 비슷한 값 (bucket: (limit, window 초))
+DEFAULT_BUCKETS = {
+    "reactions": (1, 0.25),
+    "messages": (50, 1.0),
+    "misc": (50, 1.0),
+}
+
+
+def _user(user_id: int, name: str, *, bot: bool = False) -> dict:
+    return {
+        "id": str(user_id),
+        "username": name,
+        "global_name": name,
+        "discriminator": "0",
+        "avatar": None,
+        "bot": bot,
+    }
+
+
+def _member(user_id: int) -> dict:
+    return {
+        "user": _user(user_id, f"member-{user_id % 10000:04d}"),
+        "roles": [str(ROLE_ID)],
+        "joined_at": "2024-01-01T00:00:00+00:00",
+        "deaf": False,
+        "mute": False,
+        "flags": 0,
+    }
+
+
+def synthetic_events(*, users: int, messages: int, duration: float, switch_ratio: float, seed: int) -> list[dict]:
+    """
+    9시 반응 폭주를 흉내낸 게이트웨이 이벤트를 만듭니다.
+
+    Args:
+        users: 반응하는 멤버 수
+        messages: 출석 체크 메시지 수
+        duration: 반응이 몰리는 시간(초)
+        switch_ratio: 답을 한 번 바꾸는 멤버 비율
+        seed: 난수 시드
+
+    Returns:
+        {"t", "d", "ts"} 형태의 이벤트 리스트 (ts 오름차순)
+    """
+    rng = random.Random(seed)
+    events = []
+    for m in range(messages):
+        message_id = BASE_MESSAGE_ID + m
+        for u in range(users):
+            user_id = BASE_USER_ID + u
+            first = rng.choice([EMOJI_CHECK, EMOJI_CROSS])
+            choices = [first]
+            if rng.random() < switch_ratio:
+                choices.append(EMOJI_CROSS if first == EMOJI_CHECK else EMOJI_CHECK)
+
+            ts = rng.expovariate(3.0 / duration)
+            for emoji in choices:
+                events.append({
+                    "t": "MESSAGE_REACTION_ADD",
+                    "ts": min(ts, duration),
+                    "d": {
+                        "user_id": str(user_id),
+                        "channel_id": str(CHANNEL_ID),
+                        "message_id": str(message_id),
+                        "guild_id": str(GUILD_ID),
+                        "emoji": {"id": None, "name": emoji},
+                        "member": _member(user_id),
+                        "burst": False,
+                        "type": 0,
+                    },
+                })
+                ts += rng.uniform(0.5, 3.0)
+
+    events.sort(key=lambda e: e["ts"])
+    return events
+
+
+def load_events(path: str) -> list[dict]:
+    """
+    JSONL 파일에서 게이트웨이 이벤트를 읽습니다.
+    MESSAGE_REACTION_ADD 외의 이벤트는 무시하고, ts가 없으면 0으로 간주합니다.
+
+    Args:
+        path: JSONL 파일 경로
+
+    Returns:
+        ts 오름차순으로 정렬된 이벤트 리스트
+    """
+    events = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if record.get("t") != "MESSAGE_REACTION_ADD":
+                continue
+            record.setdefault("ts", 0.0)
+            events.append(record)
+
+    events.sort(key=lambda e: e["ts"])
+    return events
+
+
+class DiscordStub:
+    """
+    Discord REST API 스텁 서버.
+    봇이 반응 처리 중 호출하는 엔드포인트만 흉내내고, 버킷별 고정 윈도우로
+    X-RateLimit-* 헤더와 429 응답을 돌려줍니다.
+    """
+
+    def __init__(self, *, latency: float, jitter: float, buckets: dict[str, tuple[int, float]], seed: int):
+        self.latency = latency
+        self.jitter = jitter
+        self.buckets = buckets
+        self._rng = random.Random(seed)
+        self._windows: dict[str, tuple[float, int]] = {}
+        self._message_ids = itertools.count(BASE_MESSAGE_ID + 100000)
+        self.calls: collections.Counter = collections.Counter()
+        self.rate_limited: collections.Counter = collections.Counter()
+        self._runner: web.AppRunner | None = None
+        self.url = ""
+
+    async def start(self) -> str:
+        """스텁 서버를 임의 포트로 띄우고 API base URL을 반환합니다."""
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get('/api/v10/users/@me', self._get_me)
+        app.router.add_get('/api/v10/oauth2/applications/@me', self._get_application)
+        app.router.add_get('/api/v10/channels/{channel_id}/messages/{message_id}', self._get_message)
+        app.router.add_post('/api/v10/channels/{channel_id}/messages', self._post_message)
+        app.router.add_patch('/api/v10/channels/{channel_id}/messages/{message_id}', self._get_message)
+        app.router.add_put(
+            '/api/v10/channels/{channel_id}/messages/{message_id}/reactions/{emoji}/@me', self._no_content
+        )
+        app.router.add_delete(
+            '/api/v10/channels/{channel_id}/messages/{message_id}/reactions/{emoji}/{user_id}', self._no_content
+        )
+
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/api/v10"
+        return self.url
+
+    async def stop(self):
+        if self._runner:
+            await self._runner.cleanup()
+
+    @staticmethod
+    def _bucket_of(request: web.Request) -> tuple[str, str]:
+        """(버킷 종류, 버킷 키) 를 반환합니다. 반응 엔드포인트는 채널 단위로 묶입니다."""
+        path = request.path
+        channel_id = request.match_info.get('channel_id', '')
+        if '/reactions/' in path:
+            return "reactions", f"reactions:{channel_id}"
+        if '/messages' in path:
+            return "messages", f"messages:{channel_id}"
+        return "misc", "misc"
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        resource = request.match_info.route.resource
+        route = f"{request.method} {resource.canonical if resource else request.path}"
+        self.calls[route] += 1
+
+        kind, key = self._bucket_of(request)
+        limit, window = self.buckets[kind]
+        now = time.monotonic()
+        started, count = self._windows.get(key, (now, 0))
+        if now - started >= window:
+            started, count = now, 0
+        reset_after = max(window - (now - started), 0.0)
+
+        headers = {
+            "X-RateLimit-Limit": str(limit),
+            "X-RateLimit-Bucket": key,
+            "X-RateLimit-Reset-After": f"{reset_after:.3f}",
+            "X-RateLimit-Reset": f"{time.time() + reset_after:.3f}",
+            "Via": "1.1 stub",
+        }
+
+        if count >= limit:
+            self.rate_limited[route] += 1
+            headers["X-RateLimit-Remaining"] = "0"
+            headers["X-RateLimit-Scope"] = "user"
+            headers["Retry-After"] = f"{reset_after:.3f}"
+            return _json_response(
+                {"message": "You are being rate limited.", "retry_after": reset_after, "global": False},
+                status=429,
+                headers=headers
+            )
+
+        self._windows[key] = (started, count + 1)
+        headers["X-RateLimit-Remaining"] = str(limit - count - 1)
+
+        delay = self.latency + self._rng.uniform(0, self.jitter)
+        await asyncio.sleep(delay)
+
+        response = await handler(request)
+        response.headers.update(headers)
+        return response
+
+    async def _get_me(self, request: web.Request) -> web.Response:
+        return _json_response(_user(BOT_USER_ID, "hillkeeper-replay", bot=True))
+
+    async def _get_application(self, request: web.Request) -> web.Response:
+        return _json_response({
+            "id": str(BOT_USER_ID),
+            "name": "hillkeeper-replay",
+            "description": "",
+            "icon": None,
+            "bot_public": False,
+            "bot_require_code_grant": False,
+            "verify_key": "0" * 64,
+            "owner": _user(BOT_USER_ID + 1, "owner"),
+            "flags": 0,
+        })
+
+    async def _get_message(self, request: web.Request) -> web.Response:
+        return _json_response(_message(int(request.match_info['channel_id']), int(request.match_info['message_id'])))
+
+    async def _post_message(self, request: web.Request) -> web.Response:
+        message_id = next(self._message_ids)
+        return _json_response(_message(int(request.match_info['channel_id']), message_id))
+
+    async def _no_content(self, request: web.Request) -> web.Response:
+        return web.Response(status=204)
+
+
+def _json_response(data: dict, *, status: int = 200, headers: dict | None = None) -> web.Response:
+    """discord.py는 Content-Type이 정확히 application/json일 때만 JSON으로 파싱합니다."""
+    return web.Response(
+        body=json.dumps(data).encode(),
+        status=status,
+        headers={"Content-Type": "application/json", **(headers or {})}
+    )
+
+
+def _message(channel_id: int, message_id: int) -> dict:
+    return {
+        "id": str(message_id),
+        "channel_id": str(channel_id),
+        "guild_id": str(GUILD_ID),
+        "author": _user(BOT_USER_ID, "hillkeeper-replay", bot=True),
+        "content": f"<@&{ROLE_ID}>",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "edited_timestamp": None,
+        "tts": False,
+        "mention_everyone": False,
+        "mentions": [],
+        "mention_roles": [str(ROLE_ID)],
+        "attachments": [],
+        "embeds": [],
+        "reactions": [],
+        "pinned": False,
+        "type": 0,
+        "flags": 0,
+    }
+
+
+def _guild_create(events: list[dict], *, idle_members: int = 0) -> dict:
+    """
+    재생할 이벤트에 등장하는 채널/멤버로 GUILD_CREATE 페이로드를 만듭니다.
+    idle_members만큼 반응하지 않는 멤버를 추가해 실제 서버 규모의 멤버 캐시를 흉내냅니다.
+    """
+    guild_ids = {e["d"].get("guild_id") for e in events}
+    guild_id = next(iter(guild_ids - {None}), str(GUILD_ID))
+    channel_ids = {e["d"]["channel_id"] for e in events}
+
+    members = {}
+    role_ids = {str(ROLE_ID)}
+    for e in events:
+        member = e["d"].get("member")
+        if member:
+            members[member["user"]["id"]] = member
+            role_ids.update(member.get("roles", []))
+    for i in range(idle_members):
+        member = _member(BASE_IDLE_USER_ID + i)
+        members[member["user"]["id"]] = member
+
+    return {
+        "id": guild_id,
+        "name": "hillkeeper-replay",
+        "unavailable": False,
+        "member_count": len(members) + 1,
+        "roles": [
+            {"id": role_id, "name": f"role-{role_id}", "permissions": "0", "position": 0,
+             "color": 0, "hoist": False, "managed": False, "mentionable": True}
+            for role_id in role_ids | {guild_id}
+        ],
+        "channels": [
+            {"id": channel_id, "type": 0, "name": f"channel-{channel_id}", "position": i,
+             "permission_overwrites": [], "guild_id": guild_id}
+            for i, channel_id in enumerate(sorted(channel_ids))
+        ],
+        "members": [_member(BOT_USER_ID) | {"user": _user(BOT_USER_ID, "hillkeeper-replay", bot=True)}]
+        + list(members.values()),
+        "threads": [],
+        "emojis": [],
+        "stickers": [],
+        "features": [],
+    }
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(int(round(pct / 100 * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+def _emoji_key(payload_emoji: dict) -> str:
+    """핸들러가 받는 str(payload.emoji)와 같은 형태로 이모지 키를 만듭니다. (커스텀 이모지: <:name:id>)"""
+    return str(discord.PartialEmoji.from_dict(payload_emoji))
+
+
+async def replay(events: list[dict], *, speed: float, stub: DiscordStub, idle_members: int = 0,
+                 timeout: float = 60.0) -> dict:
+    """
+    이벤트를 실제 핸들러에 재생하고 결과 통계를 반환합니다.
+
+    Args:
+        events: 재생할 게이트웨이 이벤트
+        speed: 재생 속도 배율 (2.0이면 두 배 빠르게, 0이면 지연 없이 한꺼번에)
+        stub: 실행 중인 Discord REST 스텁
+        idle_members: 멤버 캐시에 추가할 반응하지 않는 멤버 수
+        timeout: 마지막 이벤트 전송 후 처리 완료를 기다릴 최대 시간(초)
+
+    Returns:
+        지연 시간, REST 호출 수, 429 횟수, GC 일시정지 등이 담긴 딕셔너리
+    """
+    discord.http.Route.BASE = stub.url
+
+    intents = discord.Intents.default()
+    intents.members = True
+    client = discord.Client(intents=intents, chunk_guilds_at_startup=False)
+    register_events(client)
+
+    started_at: dict[tuple, collections.deque] = collections.defaultdict(collections.deque)
+    latencies: list[float] = []
+    errors: list[str] = []
+    done = asyncio.Event()
+    pending = 0
+
+    handler = client.on_raw_reaction_add
+
+    async def timed_on_raw_reaction_add(payload):
+        nonlocal pending
+        key = (payload.message_id, payload.user_id, str(payload.emoji))
+        t0 = time.perf_counter()
+        try:
+            t0 = started_at[key].popleft()
+            await handler(payload)
+        except Exception as e:
+            errors.append(repr(e))
+        finally:
+            latencies.append(time.perf_counter() - t0)
+            pending -= 1
+            if pending == 0:
+                done.set()
+
+    client.on_raw_reaction_add = timed_on_raw_reaction_add
+
+    await client.login("replay-token")
+    parsers = client._connection.parsers
+    parsers['GUILD_CREATE'](_guild_create(events, idle_members=idle_members))
+    # 실제 봇의 on_ready와 같은 시점 (멤버 캐시 적재 후)
+    frozen = freeze_heap()
+
+    message_ids = {(int(e["d"]["message_id"]), int(e["d"]["channel_id"])) for e in events}
+    for message_id, channel_id in message_ids:
+        await repository.save_event(message_id, channel_id=channel_id, role_id=ROLE_ID, ttl=600)
+
+    stub.calls.clear()
+    stub.rate_limited.clear()
+
+    gc_pauses = GCPauseRecorder(maxlen=None)
+    gc_pauses.start()
+    run_started = time.perf_counter()
+    try:
+        for event in events:
+            if speed > 0:
+                delay = event["ts"] / speed - (time.perf_counter() - run_started)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            data = event["d"]
+            key = (int(data["message_id"]), int(data["user_id"]), _emoji_key(data["emoji"]))
+            started_at[key].append(time.perf_counter())
+            pending += 1
+            done.clear()
+            parsers['MESSAGE_REACTION_ADD'](data)
+
+        if pending:
+            try:
+                await asyncio.wait_for(done.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                errors.append(f"timed out after {timeout}s with {pending} events pending")
+        elapsed = time.perf_counter() - run_started
+    finally:
+        gc_pauses.stop()
+        # 세대 2(전체) 수집 한 번의 비용 - 멤버 캐시가 클수록, 고정(freeze)하지 않을수록 길어짐
+        full_collect_started = time.perf_counter()
+        gc.collect()
+        full_collect = time.perf_counter() - full_collect_started
+        for message_id, _ in message_ids:
+            await repository.delete_event(message_id)
+            await redis_client.client.delete(keys.responses_key(message_id))
+        await client.close()
+
+    return {
+        "events": len(events),
+        "errors": len(errors),
+        "elapsed_s": round(elapsed, 3),
+        "throughput_per_s": round(len(events) / elapsed, 1) if elapsed else 0.0,
+        "latency_ms": {
+            "mean": round(statistics.fmean(latencies) * 1000, 2) if latencies else 0.0,
+            "p50": round(_percentile(latencies, 50) * 1000, 2),
+            "p95": round(_percentile(latencies, 95) * 1000, 2),
+            "p99": round(_percentile(latencies, 99) * 1000, 2),
+            "max": round(max(latencies, default=0.0) * 1000, 2),
+        },
+        "rest_calls": dict(stub.calls),
+        "rest_calls_total": sum(stub.calls.values()),
+        "rate_limited": dict(stub.rate_limited),
+        "rate_limited_total": sum(stub.rate_limited.values()),
+        "gc": {
+            "frozen": frozen,
+            "full_collect_ms": round(full_collect * 1000, 2),
+            **{
+                f"gen{generation}": {
+                    "count": len(pauses),
+                    "total_ms": round(sum(pauses) * 1000, 2),
+                    "max_ms": round(max(pauses, default=0.0) * 1000, 2),
+                }
+                for generation, pauses in gc_pauses.pauses.items()
+            },
+        },
+        "error_samples": errors[:5],
+    }
+
+
+def print_report(result: dict):
+    """재생 결과를 사람이 읽기 좋게 출력합니다."""
+    latency = result["latency_ms"]
+    print(f"events        {result['events']} ({result['errors']} errors) in {result['elapsed_s']}s "
+          f"({result['throughput_per_s']}/s)")
+    print(f"latency (ms)  mean={latency['mean']} p50={latency['p50']} p95={latency['p95']} "
+          f"p99={latency['p99']} max={latency['max']}")
+    print("GC pauses     " + " ".join(
+        f"{generation}={stats['count']}x/{stats['total_ms']}ms(max {stats['max_ms']})"
+        for generation, stats in result["gc"].items() if generation.startswith("gen")
+    ) + f" frozen={result['gc']['frozen']} full_collect={result['gc']['full_collect_ms']}ms")
+    print(f"REST calls    {result['rest_calls_total']} (429: {result['rate_limited_total']})")
+    for route, count in sorted(result["rest_calls"].items()):
+        limited = result["rate_limited"].get(route, 0)
+        print(f"  {count:>6}  {route}" + (f"  (429 x{limited})" if limited else ""))
+    for sample in result["error_samples"]:
+        print(f"  error: {sample}")
+
+
+def use_replay_redis():
+    """
+    REDIS_URL을 REPLAY_REDIS_URL로 바꿔 재생 전용 Redis만 사용하게 합니다.
+
+    Raises:
+        SystemExit: REPLAY_REDIS_URL이 없거나 REDIS_URL과 같은 경우
+    """
+    replay_url = get_env('REPLAY_REDIS_URL')
+    if not replay_url:
+        raise SystemExit("REPLAY_REDIS_URL is required (replay overwrites and deletes attendance keys)")
+    if replay_url == get_env('REDIS_URL'):
+        raise SystemExit("REPLAY_REDIS_URL must differ from REDIS_URL")
+    os.environ['REDIS_URL'] = replay_url
+
+
+async def main(args: argparse.Namespace):
+    """스텁 서버를 띄우고 이벤트를 재생합니다."""
+    if args.events:
+        events = load_events(args.events)
+    else:
+        events = synthetic_events(
+            users=args.users,
+            messages=args.messages,
+            duration=args.duration,
+            switch_ratio=args.switch_ratio,
+            seed=args.seed
+        )
+
+    buckets = dict(DEFAULT_BUCKETS)
+    buckets["reactions"] = (args.reaction_limit, args.reaction_window)
+    if args.no_rate_limits:
+        buckets = {kind: (sys.maxsize, window) for kind, (_, window) in buckets.items()}
+
+    stub = DiscordStub(latency=args.latency / 1000, jitter=args.jitter / 1000, buckets=buckets, seed=args.seed)
+    await stub.start()
+    await redis_client.connect()
+    try:
+        result = await replay(
+            events,
+            speed=args.speed,
+            stub=stub,
+            idle_members=args.idle_members,
+            timeout=args.timeout
+        )
+    finally:
+        await redis_client.disconnect()
+        await stub.stop()
+
+    if args.json:
+        json.dump(result, sys.stdout, ensure_ascii=False)
+        print()
+    else:
+        print_report(result)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Replay gateway reaction events against a stub Discord API.')
+    parser.add_argument('--events', help='JSONL file of recorded gateway events (default: synthetic)')
+    parser.add_argument('--users', type=int, default=40, help='synthetic: members reacting')
+    parser.add_argument('--messages', type=int, default=1, help='synthetic: attendance messages')
+    parser.add_argument('--duration', type=float, default=5.0, help='synthetic: storm length in seconds')
+    parser.add_argument('--switch-ratio', type=float, default=0.2, help='synthetic: share of members who change answer')
+    parser.add_argument('--idle-members', type=int, default=0, help='members in the cache who never react')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--speed', type=float, default=1.0, help='replay speed multiplier (0 = as fast as possible)')
+    parser.add_argument('--latency', type=float, default=80.0, help='stub REST latency in ms')
+    parser.add_argument('--jitter', type=float, default=40.0, help='stub REST latency jitter in ms')
+    parser.add_argument('--reaction-limit', type=int, default=DEFAULT_BUCKETS["reactions"][0])
+    parser.add_argument('--reaction-window', type=float, default=DEFAULT_BUCKETS["reactions"][1])
+    parser.add_argument('--timeout', type=float, default=60.0, help='seconds to wait for pending handlers after the last event')
+    parser.add_argument('--no-rate-limits', action='store_true', help='never return 429 (isolate handler cost)')
+    parser.add_argument('--json', action='store_true', help='print the result as JSON')
+
+    args = parser.parse_args()
+    use_replay_redis()
+    configure_gc()
+    asyncio.run(main(args), loop_factory=get_loop_factory())
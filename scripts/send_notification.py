@@ -18,13 +18,17 @@ import sys
 import discord
 from discord.ext import commands
 
-from hillkeeper.config import get_env
+from hillkeeper.config import get_attendance_mode, get_env
 from hillkeeper.attendance.service import send_morning_check, send_evening_reminder
+from hillkeeper.bot.views import create_attendance_view
 from hillkeeper.database.redis import redis_client
 
 
 async def main(notification_type: str):
     """알림을 수동으로 발송합니다."""
+    # 설정 검증 (봇 접속 전에 실패하도록)
+    get_attendance_mode()
+
     # Bot 초기화
     intents = discord.Intents.default()
     intents.members = True
@@ -45,7 +49,7 @@ async def main(notification_type: str):
 
             if notification_type == 'morning':
                 print(f'Sending morning check to channel {channel_id}...')
-                await send_morning_check(bot, channel_id, role_id, is_test=False)
+                await send_morning_check(bot, channel_id, role_id, is_test=False, create_view=create_attendance_view)
                 print('✅ Morning check sent successfully!')
             elif notification_type == 'evening':
                 print(f'Sending evening reminder to channel {channel_id}...')